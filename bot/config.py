@@ -202,4 +202,5 @@ TRADING212_CONFIG = {
 LOG_CONFIG = {
     "log_file": "logs/trading_bot.log",  # Updated to store logs in the logs directory
     "level": "DEBUG",
+    "dashboard_level": os.getenv("DASHBOARD_LOG_LEVEL", "INFO").upper(),  # DEBUG for per-tick UI traces
 }
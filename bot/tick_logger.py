@@ -36,8 +36,27 @@ class TickLogger:
             tick: Tick data
             event: Strategy event output
         """
+        with open(self.tick_log_file, "a") as f:
+            f.write(self._tick_line(tick, event))
+    
+    def log_ticks(self, entries):
+        """
+        Log a batch of ticks with a single file write
+        
+        Args:
+            entries: Iterable of (tick, event, logged_at) oldest first, where
+                logged_at is the time.time() the tick was queued
+        """
+        lines = "".join(self._tick_line(tick, event, datetime.fromtimestamp(logged_at))
+                        for tick, event, logged_at in entries)
+        if lines:
+            with open(self.tick_log_file, "a") as f:
+                f.write(lines)
+    
+    def _tick_line(self, tick: Tick, event: dict, logged_at: datetime = None) -> str:
+        """One JSONL record for a tick and its strategy event"""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": (logged_at or datetime.now()).isoformat(),
             "tick_count": event["metrics"]["total_ticks"],
             "price": tick.price,
             "volume": tick.volume,
@@ -58,8 +77,7 @@ class TickLogger:
         if calc:
             entry["calc"] = calc
         
-        with open(self.tick_log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        return json.dumps(entry) + "\n"
     
     def log_trade(self, trade):
         """Log completed trade"""
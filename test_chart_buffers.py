@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test script for the dashboard chart buffers (websocket_ui/chart_buffers.py).
+
+Covers the index bookkeeping: RingBuffer wraparound, SignalBuffer compaction
+and pruning, and SlidingMinMax eviction as the window slides. The randomized
+tests replay the same ticks through the deque-based code these buffers
+replaced and require identical chart data.
+"""
+
+import random
+import sys
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from websocket_ui.chart_buffers import RingBuffer, SignalBuffer, SlidingMinMax
+
+
+def test_ring_buffer_wraparound():
+    """Appending past capacity keeps the newest values, oldest first, in one view"""
+    ring = RingBuffer(4)
+    assert len(ring) == 0 and ring.view().tolist() == []
+
+    for value in range(1, 4):
+        ring.append(value)
+    assert ring.view().tolist() == [1, 2, 3]
+
+    # Wrap the head around twice; the view must stay ordered at every step
+    for value in range(4, 12):
+        ring.append(value)
+        assert ring.view().tolist() == list(range(max(1, value - 3), value + 1))
+    assert len(ring) == ring.maxlen == 4
+
+    ring.clear()
+    ring.append(99)
+    assert ring.view().tolist() == [99]
+    print("✅ RingBuffer: wraparound keeps the newest window in order")
+
+
+def test_signal_buffer_append_past_capacity():
+    """A full buffer with nothing pruned drops its oldest record, like deque(maxlen)"""
+    signals = SignalBuffer(3)
+    for i in range(5):
+        signals.append(i * 10, 100.0 + i, trade_id=i + 1, cost=float(i))
+    assert len(signals) == 3
+    live = slice(signals.lo, signals.hi)
+    assert signals.idx[live].tolist() == [20, 30, 40]
+    assert signals.price[live].tolist() == [102.0, 103.0, 104.0]
+    assert signals.trade_id[live].tolist() == [3, 4, 5]
+    assert signals.cost[live].tolist() == [2.0, 3.0, 4.0]
+    print("✅ SignalBuffer: append past capacity drops the oldest record")
+
+
+def test_signal_buffer_prune_across_compaction():
+    """Pruned records free room: a full buffer compacts the live span instead of dropping"""
+    signals = SignalBuffer(4)
+    for idx in (1, 3, 5, 7):
+        signals.append(idx, float(idx))
+
+    signals.prune_before(4)  # Boundary falls between records
+    assert (signals.lo, signals.hi) == (2, 4)
+    assert signals.idx[signals.lo:signals.hi].tolist() == [5, 7]
+
+    # hi is at capacity: this append compacts [5, 7] to the front and keeps both
+    signals.append(9, 9.0)
+    assert (signals.lo, signals.hi) == (0, 3)
+    assert signals.idx[:3].tolist() == [5, 7, 9]
+    assert signals.price[:3].tolist() == [5.0, 7.0, 9.0]
+
+    signals.prune_before(7)  # Exact index: 7 stays
+    assert signals.idx[signals.lo:signals.hi].tolist() == [7, 9]
+    signals.prune_before(7)  # Idempotent
+    assert len(signals) == 2
+    signals.prune_before(100)  # Everything scrolled off
+    assert len(signals) == 0
+    signals.append(101, 1.0)
+    assert signals.idx[signals.lo:signals.hi].tolist() == [101]
+    print("✅ SignalBuffer: prune_before and compaction keep the live records")
+
+
+def test_sliding_min_max_window():
+    """min/max track only the last `window` values as old extremes slide out"""
+    extrema = SlidingMinMax(3)
+    assert extrema.min is None and extrema.max is None
+
+    expected = [
+        (5, 5, 5),
+        (1, 1, 5),
+        (4, 1, 5),
+        (3, 1, 4),  # 5 slid out
+        (2, 2, 4),  # 1 slid out
+        (6, 2, 6),
+        (6, 2, 6),  # Equal values replace each other in the deques
+        (0, 0, 6),
+        (7, 0, 7),
+    ]
+    for value, low, high in expected:
+        extrema.append(value)
+        assert (extrema.min, extrema.max) == (low, high), (value, extrema.min, extrema.max)
+
+    extrema.clear()
+    assert extrema.min is None
+    extrema.append(10)
+    assert (extrema.min, extrema.max) == (10, 10)
+    print("✅ SlidingMinMax: extremes are evicted once they leave the window")
+
+
+def _shift_and_prune_signals(signal_deque, shift=-1):
+    """The deque bookkeeping the legacy dashboard used before SignalBuffer: every
+    record's chart x is shifted left when the price window slides, and records
+    that fall off the chart are dropped"""
+    updated = deque((x + shift, p, tid, cost) for x, p, tid, cost in signal_deque if x + shift >= 0)
+    signal_deque.clear()
+    signal_deque.extend(updated)
+
+
+def test_buffers_match_deques():
+    """Random tick streams give the same window, extremes and markers as the deques"""
+    rng = random.Random(20240102)
+    for window in (1, 2, 5, 100):
+        prices_dq = deque(maxlen=window)
+        signals_dq = deque()  # (chart x, price, trade_id, cost)
+        ring = RingBuffer(window)
+        extrema = SlidingMinMax(window)
+        signals = SignalBuffer(window)
+        tick_count = 0
+
+        for _ in range(20 * window + 50):
+            price = round(rng.uniform(99.0, 101.0), 2)
+            window_full = len(prices_dq) == prices_dq.maxlen
+            prices_dq.append(price)
+            if window_full:
+                _shift_and_prune_signals(signals_dq)
+            ring.append(price)
+            extrema.append(price)
+            tick_idx = tick_count
+            tick_count += 1
+
+            if rng.random() < 0.3:  # At most one marker per tick, as in the dashboards
+                trade_id = tick_idx + 1
+                cost = round(price * 10, 2)
+                signals_dq.append((len(prices_dq) - 1, price, trade_id, cost))
+                signals.append(tick_idx, price, trade_id, cost)
+
+            assert ring.view().tolist() == list(prices_dq)
+            assert (extrema.min, extrema.max) == (min(prices_dq), max(prices_dq))
+
+            if rng.random() < 0.4:  # Dashboards prune once per frame, not every tick
+                origin = tick_count - len(ring)
+                signals.prune_before(origin)
+                live = slice(signals.lo, signals.hi)
+                rows = list(zip((signals.idx[live] - origin).tolist(), signals.price[live].tolist(),
+                                signals.trade_id[live].tolist(), signals.cost[live].tolist()))
+                assert rows == list(signals_dq), (window, tick_count)
+    print("✅ RingBuffer/SlidingMinMax/SignalBuffer match the deque implementation")
+
+
+if __name__ == "__main__":
+    test_ring_buffer_wraparound()
+    test_signal_buffer_append_past_capacity()
+    test_signal_buffer_prune_across_compaction()
+    test_sliding_min_max_window()
+    test_buffers_match_deques()
+    print("\nALL CHART BUFFER TESTS PASSED")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for the legacy dashboard's WebSocket frame decoding.
+
+The server sends symbol snapshots as binary frames (encode_snapshot) and trade
+events / acks as text frames; the dashboard must parse both, with orjson or
+with the stdlib fallback.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from websocket_server.server import encode_snapshot
+from websocket_ui import trading_dashboard
+
+SNAPSHOT = {"timestamp": "2024-01-02T15:30:00", "symbols": {"AAPL": {"ticker": {"ticker": "AAPL", "min": {"c": 185.2}}}}}
+TRADE_EVENT = {"type": "TRADE_EVENT", "action": "OPEN", "symbol": "AAPL", "trade": {"entry_price": 185.2}}
+
+# Whatever json_loads the dashboard picked, plus the stdlib fallback it uses without orjson
+PARSERS = {"dashboard": trading_dashboard.json_loads, "stdlib": json.loads}
+
+
+def test_binary_snapshot_frame():
+    """Binary frames (bytes) decode to the snapshot the server encoded"""
+    frame = encode_snapshot(SNAPSHOT)
+    assert isinstance(frame, bytes)
+    for name, parse in PARSERS.items():
+        assert parse(frame) == SNAPSHOT, name
+        print(f"✅ {name}: binary snapshot frame decoded")
+
+
+def test_text_frame():
+    """Text frames (str), as sent for trade events and acks, still decode"""
+    frame = json.dumps(TRADE_EVENT)
+    for name, parse in PARSERS.items():
+        assert parse(frame) == TRADE_EVENT, name
+        print(f"✅ {name}: text frame decoded")
+
+
+def test_malformed_frames_are_skippable():
+    """Malformed frames raise only the errors websocket_loop skips"""
+    skipped = (json.JSONDecodeError, UnicodeDecodeError)
+    for name, parse in PARSERS.items():
+        for frame in (b"\xff{", b"{not json", "{not json"):
+            try:
+                parse(frame)
+            except skipped:
+                continue
+            raise AssertionError(f"{name} accepted malformed frame {frame!r}")
+        print(f"✅ {name}: malformed frames rejected with a skippable error")
+
+
+if __name__ == "__main__":
+    test_binary_snapshot_frame()
+    test_text_frame()
+    test_malformed_frames_are_skippable()
+    print("\nALL FRAME DECODING TESTS PASSED")
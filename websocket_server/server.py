@@ -5,6 +5,7 @@ import sys
 import string
 import time
 import random
+from collections import deque
 from datetime import datetime
 from typing import Set, List, Dict
 
@@ -33,6 +34,17 @@ logger = logging.getLogger(__name__)
 # Store connected clients
 connected_clients: Set = set()
 
+# Per-client send buffers drained by a relay task each, so one slow client never
+# stalls a broadcast. Once CLIENT_OUTBOX_SIZE messages are pending, a new snapshot
+# is merged into the last pending message when that is a snapshot too (latest update
+# per symbol wins, symbols only in the older one are kept), so nothing is reordered.
+# Trade events and acks are never merged or dropped: a client that falls
+# CLIENT_OUTBOX_LIMIT messages behind is disconnected instead.
+CLIENT_OUTBOX_SIZE = 64
+CLIENT_OUTBOX_LIMIT = 4 * CLIENT_OUTBOX_SIZE
+client_outboxes: Dict = {}  # {websocket: (deque[(message, payload)], asyncio.Event)}
+client_coalesced: Dict = {}  # {websocket: snapshot updates superseded in its outbox}
+
 # Global historical data cache
 HISTORICAL_DATA_CACHE: Dict[str, List[dict]] = {}  # {symbol: [bars]}
 
@@ -276,30 +288,98 @@ def map_aggregate_to_snapshot(event: dict) -> dict | None:
         return None
 
 
+def encode_snapshot(payload: dict) -> bytes:
+    """Binary frame: clients skip the per-frame UTF-8 check; json.loads/orjson take bytes directly"""
+    return json.dumps(payload).encode()
+
+
+def queue_for_client(client, message, payload: dict = None) -> None:
+    """Hand a message to the client's relay task without awaiting the socket.
+
+    payload is the decoded form of a symbol snapshot message; only those can be
+    coalesced when the client falls behind. Other messages are always queued.
+    """
+    outbox = client_outboxes.get(client)
+    if outbox is None:
+        return
+    pending, wakeup = outbox
+    if payload is not None and len(pending) >= CLIENT_OUTBOX_SIZE and pending[-1][1] is not None:
+        # Merge into the last pending message, a snapshot: no symbol loses its latest update
+        queued = pending[-1][1]
+        superseded = queued["symbols"].keys() & payload["symbols"].keys()
+        merged = {
+            "timestamp": payload["timestamp"],
+            "symbols": {**queued["symbols"], **payload["symbols"]},
+        }
+        pending[-1] = (encode_snapshot(merged), merged)
+        if superseded:
+            count = client_coalesced.get(client, 0) + len(superseded)
+            client_coalesced[client] = count
+            logger.warning(
+                f"Client {client.remote_address} outbox full: superseded "
+                f"{len(superseded)} symbol updates ({count} total for this client)"
+            )
+    elif len(pending) >= CLIENT_OUTBOX_LIMIT:
+        logger.error(
+            f"Client {client.remote_address} is {len(pending)} messages behind; disconnecting it"
+        )
+        forget_client(client)
+        pending.clear()
+        pending.append((None, None))  # Tells the relay to close the connection
+    else:
+        pending.append((message, payload))
+    wakeup.set()
+
+
+def forget_client(client) -> None:
+    """Stop broadcasting to a client and release its outbox (safe to call twice)."""
+    connected_clients.discard(client)
+    client_outboxes.pop(client, None)
+    client_coalesced.pop(client, None)
+
+
+def broadcast(message, payload: dict = None, exclude=None) -> int:
+    """Queue a message for every connected client (optionally skipping one); returns the count."""
+    sent = 0
+    for client in list(connected_clients):
+        if client is not exclude:
+            queue_for_client(client, message, payload)
+            sent += 1
+    return sent
+
+
+async def client_relay(websocket, pending: deque, wakeup: asyncio.Event) -> None:
+    """Send a client's queued messages in order until its connection closes."""
+    try:
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            while pending:
+                message, _ = pending.popleft()
+                if message is None:
+                    await websocket.close(code=1013, reason="Client fell too far behind")
+                    return
+                await websocket.send(message)
+    except websockets.exceptions.ConnectionClosed:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to send to client: {e}")
+    finally:
+        forget_client(websocket)
+
+
 async def broadcast_symbols(symbol_snapshots: dict) -> None:
     """Broadcast symbol snapshots to all connected clients."""
     if not symbol_snapshots:
         return
 
-    message = json.dumps({
+    payload = {
         "timestamp": int(time.time() * 1e9),
         "symbols": symbol_snapshots,
-    })
-
-    disconnected_clients = set()
-    for client in connected_clients:
-        try:
-            await client.send(message)
-        except websockets.exceptions.ConnectionClosed:
-            disconnected_clients.add(client)
-        except Exception as e:
-            logger.warning(f"Failed to send to client: {e}")
-            disconnected_clients.add(client)
-
-    for client in disconnected_clients:
-        connected_clients.discard(client)
+    }
 
-    logger.info(f"📡 Broadcasted {len(symbol_snapshots)} symbols to {len(connected_clients)} clients")
+    sent = broadcast(encode_snapshot(payload), payload)
+    logger.info(f"📡 Broadcasted {len(symbol_snapshots)} symbols to {sent} clients")
 
 
 async def pause_stream() -> dict:
@@ -334,6 +414,9 @@ async def get_pause_status() -> dict:
 async def handler(websocket):
     """Handle new client connections"""
     client_id = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
+    pending, wakeup = deque(), asyncio.Event()
+    client_outboxes[websocket] = (pending, wakeup)
+    relay_task = asyncio.create_task(client_relay(websocket, pending, wakeup))
     connected_clients.add(websocket)
     logger.info(f"Client connected: {client_id}")
     
@@ -349,16 +432,8 @@ async def handler(websocket):
             if data.get("type") == "TRADE_EVENT":
                 logger.info(f"📨 Received trade event from bot: {data.get('action')} for {data.get('symbol')}")
                 # Broadcast to all OTHER clients (dashboard)
-                broadcast_msg = json.dumps(data)
-                # Make a copy to avoid "Set changed size during iteration" error
-                clients_to_notify = [c for c in connected_clients if c != websocket]
-                logger.info(f"📢 Notifying {len(clients_to_notify)} dashboard clients of {data.get('action')} for {data.get('symbol')}")
-                for client in clients_to_notify:
-                    try:
-                        await client.send(broadcast_msg)
-                        logger.info(f"✅ Sent {data.get('action')} event to client")
-                    except Exception as e:
-                        logger.warning(f"❌ Failed to send trade event to client: {e}")
+                sent = broadcast(json.dumps(data), exclude=websocket)
+                logger.info(f"📢 Queued {data.get('action')} for {data.get('symbol')} to {sent} dashboard clients")
                 continue
             
             # Handle command messages (replace symbol, pause/resume, etc.)
@@ -367,16 +442,16 @@ async def handler(websocket):
                 slot = data.get("slot")
                 symbol = data.get("symbol")
                 result = await replace_symbol(slot, symbol)
-                await websocket.send(json.dumps({"type": "replace_ack", **result}))
+                queue_for_client(websocket, json.dumps({"type": "replace_ack", **result}))
             elif cmd == "pause":
                 result = await pause_stream()
-                await websocket.send(json.dumps({"type": "pause_ack", **result}))
+                queue_for_client(websocket, json.dumps({"type": "pause_ack", **result}))
             elif cmd == "resume":
                 result = await resume_stream()
-                await websocket.send(json.dumps({"type": "resume_ack", **result}))
+                queue_for_client(websocket, json.dumps({"type": "resume_ack", **result}))
             elif cmd == "get_pause_status":
                 result = await get_pause_status()
-                await websocket.send(json.dumps({"type": "pause_status", **result}))
+                queue_for_client(websocket, json.dumps({"type": "pause_status", **result}))
             else:
                 if "command" in data or data.get("type"):
                     logger.debug(f"Unknown message from {client_id}: {data}")
@@ -388,7 +463,8 @@ async def handler(websocket):
         logger.error(f"Error with client {client_id}: {e}")
     
     finally:
-        connected_clients.discard(websocket)
+        forget_client(websocket)
+        relay_task.cancel()
 
 
 async def event_broadcaster():
@@ -615,16 +691,7 @@ async def main():
 
                 async def broadcast_bot_event(event):
                     """Broadcast bot event to all connected clients"""
-                    message = json.dumps(event)
-                    disconnected = set()
-                    for client in connected_clients:
-                        try:
-                            await client.send(message)
-                        except Exception as e:
-                            logger.warning(f"Failed to send to client: {e}")
-                            disconnected.add(client)
-                    for client in disconnected:
-                        connected_clients.discard(client)
+                    broadcast(json.dumps(event))
 
                 set_broadcast_callback(broadcast_bot_event)
                 logger.info("Starting trading bot (historical playback)...")
@@ -0,0 +1,141 @@
+"""
+Fixed-window helpers shared by the dashboard charts.
+Keep per-tick bookkeeping O(1) so redraws never rescan the price window.
+"""
+
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+
+class SlidingMinMax:
+    """Running min/max over the last `window` values (monotonic deques)"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._seq = 0
+        self._min_dq: deque = deque()  # (value, seq) with increasing values
+        self._max_dq: deque = deque()  # (value, seq) with decreasing values
+
+    def append(self, value: float):
+        """Add a value and evict anything that slid out of the window"""
+        seq = self._seq
+        self._seq = seq + 1
+
+        min_dq = self._min_dq
+        while min_dq and min_dq[-1][0] >= value:
+            min_dq.pop()
+        min_dq.append((value, seq))
+
+        max_dq = self._max_dq
+        while max_dq and max_dq[-1][0] <= value:
+            max_dq.pop()
+        max_dq.append((value, seq))
+
+        oldest_seq = seq - self.window
+        if min_dq[0][1] <= oldest_seq:
+            min_dq.popleft()
+        if max_dq[0][1] <= oldest_seq:
+            max_dq.popleft()
+
+    def clear(self):
+        self._seq = 0
+        self._min_dq.clear()
+        self._max_dq.clear()
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min_dq[0][0] if self._min_dq else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max_dq[0][0] if self._max_dq else None
+
+
+class SignalBuffer:
+    """Trade markers as parallel arrays: absolute tick index, price, trade id, cost
+
+    Records live in [lo, hi). Tick indices only grow, so markers that scroll
+    off the chart are dropped from the front by advancing lo to the first
+    visible index, and the live span is compacted to the start only when hi
+    reaches capacity.
+    """
+
+    __slots__ = ("idx", "price", "trade_id", "cost", "lo", "hi")
+
+    def __init__(self, capacity: int):
+        self.idx = np.empty(capacity, dtype=np.int64)
+        self.price = np.empty(capacity, dtype=np.float64)
+        self.trade_id = np.empty(capacity, dtype=np.int64)
+        self.cost = np.empty(capacity, dtype=np.float64)  # Position cost on opens (0 for closes)
+        self.lo = 0
+        self.hi = 0
+
+    def __len__(self):
+        return self.hi - self.lo
+
+    def append(self, tick_idx: int, price: float, trade_id: int = 0, cost: float = 0.0):
+        if self.hi == len(self.idx):
+            # Drop the oldest record if the live span fills the whole buffer
+            lo = self.lo or 1
+            n = self.hi - lo
+            self.idx[:n] = self.idx[lo:self.hi]
+            self.price[:n] = self.price[lo:self.hi]
+            self.trade_id[:n] = self.trade_id[lo:self.hi]
+            self.cost[:n] = self.cost[lo:self.hi]
+            self.lo, self.hi = 0, n
+        hi = self.hi
+        self.idx[hi] = tick_idx
+        self.price[hi] = price
+        self.trade_id[hi] = trade_id
+        self.cost[hi] = cost
+        self.hi = hi + 1
+
+    def prune_before(self, tick_idx: int):
+        """Forget markers older than tick_idx (binary search over the sorted indices)"""
+        lo = self.lo
+        self.lo = lo + int(np.searchsorted(self.idx[lo:self.hi], tick_idx))
+
+    def clear(self):
+        self.lo = self.hi = 0
+
+
+class RingBuffer:
+    """Fixed-capacity numeric window with an O(1) append and a contiguous view
+
+    Every value is written twice (at i and i + capacity), so the ordered
+    window is always a single slice and never needs np.concatenate.
+    """
+
+    __slots__ = ("_buf", "_cap", "_head", "n")
+
+    def __init__(self, capacity: int, dtype=np.float64):
+        self._buf = np.zeros(2 * capacity, dtype=dtype)
+        self._cap = capacity
+        self._head = 0  # Next write position
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def maxlen(self) -> int:
+        return self._cap
+
+    def append(self, value):
+        head = self._head
+        self._buf[head] = value
+        self._buf[head + self._cap] = value
+        self._head = head + 1 if head + 1 < self._cap else 0
+        if self.n < self._cap:
+            self.n += 1
+
+    def view(self) -> np.ndarray:
+        """Oldest-to-newest window; valid until the next append"""
+        start = self._head if self.n == self._cap else 0
+        return self._buf[start:start + self.n]
+
+    def clear(self):
+        self._head = 0
+        self.n = 0
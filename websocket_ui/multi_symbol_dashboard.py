@@ -5,29 +5,150 @@ Multi-Symbol Trading Dashboard
 
 import asyncio
 import json
+import logging
+import logging.handlers
 import websockets
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from matplotlib.ticker import ScalarFormatter
-from scipy.interpolate import make_interp_spline
 from collections import deque
-from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Optional
 import threading
+import queue
+import random
+import socket
 import time
-import asyncio
 import contextlib
+from functools import partial
 import numpy as np
 
+try:
+    import uvloop
+except ImportError:  # Optional (not available on Windows) - fall back to the stock asyncio loop
+    uvloop = None
+
+try:
+    import orjson
+    json_loads = orjson.loads  # Raises a json.JSONDecodeError subclass
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()  # str keeps commands on text frames
+except ImportError:  # Optional C parser - fall back to the stdlib
+    json_loads = json.loads
+    json_dumps = json.dumps
+
 from bot.models import Tick
 from bot.strategy_manager import StrategyManager
 from bot.tick_logger import TickLogger
-from bot.config import WEBSOCKET_CONFIG, SYMBOLS
+from bot.config import WEBSOCKET_CONFIG, SYMBOLS, LOG_CONFIG
 from bot.trading212_broker import get_trading212_broker
+from websocket_ui.chart_buffers import RingBuffer, SignalBuffer, SlidingMinMax
+
+logger = logging.getLogger(__name__)
 
 # Configuration
 MAX_DATA_POINTS = 100
+TICK_LOG_QUEUE_SIZE = 10_000  # Pending tick log entries before the oldest are dropped
+TICK_LOG_BATCH = 256  # Entries written per wake-up of the tick log thread
+STATUS_REFRESH_MS = 1000  # Status line refresh period
+REDRAW_INTERVAL_MS = 50  # Chart redraws are coalesced to at most one per symbol per interval
+UI_POLL_MS = 33  # Tk-side drain period for UI state produced on the WS thread
+WS_RECV_BUFFER = 1 << 20  # Kernel receive buffer for the snapshot socket (absorbs bursts)
+WS_MAX_QUEUE = 64  # Frames websockets buffers before applying backpressure
+WS_YIELD_EVERY = 16  # Frames processed back-to-back before yielding to other WS-loop tasks
+WS_PING_INTERVAL = 20  # Keepalive ping period (seconds) on the snapshot connection
+WS_PING_TIMEOUT = 10  # Missing pong after this long marks the link dead and triggers a reconnect
+WS_RECONNECT_MAX_DELAY = 30.0  # Backoff ceiling (seconds) while the server stays down
+WS_RECONNECT_JITTER = 0.5  # Random extra delay so clients do not reconnect in lockstep
+WS_COMMAND_QUEUE_SIZE = 256  # Pending control commands kept while disconnected; beyond this replace_symbol is refused
+ORDER_QUEUE_SIZE = 256  # Broker orders waiting for the order worker; new orders are refused beyond this
+
+# Connection states shown on the status line (written by the WS thread)
+STATUS_CONNECTING = "Connecting..."
+STATUS_CONNECTED = "Connected"
+STATUS_RETRYING = "Disconnected (retrying...)"
+STATUS_ERROR = "Error"
+
+# Commands whose effect is fully replaced by a later one of the same kind
+_SUPERSEDED_COMMANDS = {"pause": "run_state", "resume": "run_state", "get_pause_status": "status"}
+# Queue slots held back for the latest command of each superseded kind
+_SUPERSEDED_SLOTS = len(set(_SUPERSEDED_COMMANDS.values()))
+
+
+def _reconnect_delay(attempt):
+    """Exponential backoff from WEBSOCKET_CONFIG['reconnect_delay'] with jitter, capped"""
+    base = WEBSOCKET_CONFIG["reconnect_delay"]
+    return min(base * 2 ** min(attempt, 16), WS_RECONNECT_MAX_DELAY) + random.uniform(0, WS_RECONNECT_JITTER)
+
+
+# Trade marker scatter styles by chart key, in legend order (built once per chart)
+_MARKER_STYLES = {
+    'buy': dict(marker='^', color='#00D084', s=200, label="BUY", zorder=5,
+                edgecolors='darkgreen', linewidths=1),
+    'sell': dict(marker='v', color='#FF6B6B', s=200, label="SELL", zorder=5,
+                 edgecolors='darkred', linewidths=1),
+    'buy_close': dict(marker='X', color='#00AA55', s=150, label="CLOSE", zorder=4,
+                      edgecolors='darkgreen', linewidths=1, alpha=0.7),
+    'sell_close': dict(marker='X', color='#CC4444', s=150, zorder=4,
+                       edgecolors='darkred', linewidths=1, alpha=0.7),
+}
+
+# Snapshot bars in price-preference order: minute > day > prevDay (market closed)
+_QUOTE_BARS = ("min", "day", "prevDay")
+
+
+def _extract_quote(snapshot):
+    """Return (price, volume, updated_ns) from a Polygon snapshot in one pass
+
+    Walks the ticker's bars once instead of chaining .get() calls with empty-dict
+    defaults. price is None when no bar has a usable close.
+    """
+    ticker = snapshot.get("ticker")
+    if not ticker:
+        return None, 0, None
+    price = None
+    volume = None
+    for key in _QUOTE_BARS:
+        bar = ticker.get(key)
+        if not bar:
+            continue
+        if not price:
+            price = bar.get("c")
+        if not volume:
+            volume = bar.get("v")
+        if price and volume:
+            break
+    return price or None, volume or 0, ticker.get("updated")
+
+
+@dataclass(slots=True)
+class SymbolState:
+    """Per-symbol state touched on every tick, kept together for one lookup
+
+    One instance is preallocated per slot and reused (clear()) when the slot is
+    rebound, so its buffers are never reallocated.
+    """
+    prices: RingBuffer = field(default_factory=partial(RingBuffer, MAX_DATA_POINTS))
+    extrema: SlidingMinMax = field(default_factory=partial(SlidingMinMax, MAX_DATA_POINTS))  # y-limits without rescanning prices
+    tick_count: int = 0  # Total ticks received
+    trade_counter: int = 0  # Id of the latest opened trade
+    open_price: Optional[float] = None  # Current open trade entry price
+    close_price: Optional[float] = None  # Last closed trade exit price
+    # Values behind the last price/P&L/trades labels sent to Tk (skip re-formatting repeats)
+    shown_price: Optional[float] = None
+    shown_pnl: Optional[float] = None
+    shown_trades: Optional[int] = None
+
+    def clear(self):
+        """Forget the previous symbol's data, keeping the buffers"""
+        self.prices.clear()
+        self.extrema.clear()
+        self.tick_count = self.trade_counter = 0
+        self.open_price = self.close_price = None
+        self.shown_price = self.shown_pnl = self.shown_trades = None
 
 
 class MultiSymbolDashboard:
@@ -41,105 +162,232 @@ class MultiSymbolDashboard:
         self.root.geometry("1600x1000")
         
         # Data storage per symbol
-        self.prices = {sym: deque(maxlen=MAX_DATA_POINTS) for sym in symbols}
-        self.bid_prices = {sym: deque(maxlen=MAX_DATA_POINTS) for sym in symbols}
-        self.ask_prices = {sym: deque(maxlen=MAX_DATA_POINTS) for sym in symbols}
-        self.tick_counts = {sym: 0 for sym in symbols}  # Track total ticks received
-        self.buy_signals = {sym: deque() for sym in symbols}  # (absolute_tick_idx, price, trade_id)
-        self.sell_signals = {sym: deque() for sym in symbols}
-        self.buy_close_signals = {sym: deque() for sym in symbols}
-        self.sell_close_signals = {sym: deque() for sym in symbols}
+        self.symbol_state = {sym: SymbolState() for sym in symbols}  # Price window, counters, cached prices
+        # Signals are (absolute_tick_idx, price, trade_id) in parallel arrays; at most one
+        # per tick, so window-sized buffers drop them as soon as they scroll off the chart
+        self.buy_signals = {sym: SignalBuffer(MAX_DATA_POINTS) for sym in symbols}
+        self.sell_signals = {sym: SignalBuffer(MAX_DATA_POINTS) for sym in symbols}
+        self.buy_close_signals = {sym: SignalBuffer(MAX_DATA_POINTS) for sym in symbols}
+        self.sell_close_signals = {sym: SignalBuffer(MAX_DATA_POINTS) for sym in symbols}
+        # (action, direction) -> marker store for trade events
+        self._signal_routes = {
+            ("OPEN", "LONG"): self.buy_signals,
+            ("OPEN", "SHORT"): self.sell_signals,
+            ("CLOSE", "LONG"): self.buy_close_signals,
+            ("CLOSE", "SHORT"): self.sell_close_signals,
+        }
+        # Chart artist key -> marker store, walked by every redraw
+        self._marker_stores = (('buy', self.buy_signals), ('sell', self.sell_signals),
+                               ('buy_close', self.buy_close_signals),
+                               ('sell_close', self.sell_close_signals))
         
         # Trading state
         self.strategy_manager = StrategyManager(symbols)
-        self.tick_counts = {sym: 0 for sym in symbols}
-        self.trade_counters = {sym: 0 for sym in symbols}
+        # Cached per-symbol strategy refs so the tick path skips the manager's lookups
+        self._strategies = {sym.upper(): self.strategy_manager.get_strategy(sym) for sym in symbols}
+        # Each strategy's opening_range dict (None when the strategy has none); the dict is
+        # mutated in place, never reassigned, so the ref stays valid for the strategy's life
+        self._opening_ranges = {sym: getattr(strategy, 'opening_range', None)
+                                for sym, strategy in self._strategies.items()}
         self.total_trades = 0  # Total trades across all symbols
         self.total_pnl = 0.0   # Total P/L across all symbols
         self.trades_by_symbol = {sym: [] for sym in symbols}  # Track closed trades per symbol
-        self.open_prices = {sym: None for sym in symbols}  # Current open trade entry price
-        self.close_prices = {sym: None for sym in symbols}  # Last closed trade exit price
-        self.connection_status = "Disconnected"
+        self.connection_status = STATUS_CONNECTING  # Written by the WS thread, shown by _refresh_status
+        self._run_state = ""  # PAUSED/RUNNING after the user toggles the feed
+        self._status_inputs = None  # (connection, run state, ticks) behind the current status text
+        self._total_ticks = 0
         self.logger = TickLogger()
         
-        # Trading212 broker for order execution
+        # Strategies run on the WS thread; Tk only receives (views, totals) through _ui_queue
+        # (deque append/popleft are thread-safe). _data_lock guards the per-symbol buffers
+        # shared with update_chart/rebind.
+        self._ui_queue = deque()
+        self._trade_events = deque()  # TRADE_EVENT dicts from the WS thread, in arrival order
+        # Incoming frame dispatch by "type" (WS thread)
+        self._message_handlers = {
+            None: self._on_snapshot_message,
+            "TRADE_EVENT": self._on_trade_event_message,
+            "replace_ack": self._on_command_ack,
+            "pause_ack": self._on_command_ack,
+            "resume_ack": self._on_command_ack,
+            "pause_status": self._on_command_ack,
+        }
+        self._data_lock = threading.Lock()
+        
+        # Tick logging runs on its own thread so file I/O never blocks the tick path
+        self._log_q = queue.Queue(maxsize=TICK_LOG_QUEUE_SIZE)
+        self._log_thread = threading.Thread(target=self._drain_tick_log, daemon=True)
+        self._log_thread.start()
+        
+        # Trading212 broker for order execution; orders go through one queue/worker on the WS loop
         self.trading212_broker = None
+        self._order_queue = None
         
         # UI components
         self.chart_frames = {}  # {symbol: {'canvas': ..., 'ax': ..., ...}}
         self.stat_labels = {}   # {symbol: {'price': ..., 'pnl': ..., ...}}
-        self.event_texts = {}   # {symbol: tk.Text}
+        self._label_state = {}  # {label: (text, foreground)} last values written by _set_label
+        self._stale_charts = set()  # Symbols whose redraw was skipped while hidden or scrolled away
+        self._grid_canvas = None  # Scrollable tk.Canvas holding the chart grid
+        self._dirty_symbols = set()  # Symbols with new data awaiting the next redraw pass
+        self._redraw_scheduled = False
 
         # Command queue for sending control messages (e.g., replace symbol) to the server
         self.ws_command_queue = None
         self.ws_loop = None
+        # Commands from Tk wait here until the WS loop drains them; one wakeup per burst
+        self._pending_commands = deque()
+        self._command_lock = threading.Lock()
+        self._command_wakeup_pending = False
+        self._unsent_kept_commands = 0  # Queued commands that are never dropped (replace_symbol), until sent
         self.ws_connection = None
         
         # Setup UI
         self.setup_ui()
+        self.root.after(STATUS_REFRESH_MS, self._refresh_status)
+        self.root.after(UI_POLL_MS, self._drain_ui_queue)
         
         # Start WebSocket connection in background thread
         self.ws_thread = threading.Thread(target=self.start_websocket, daemon=True)
         self.ws_thread.start()
 
-    def enqueue_ws_command(self, payload: dict):
-        """Thread-safe enqueue of a WebSocket control command"""
+    def enqueue_ws_command(self, payload: dict) -> bool:
+        """Thread-safe enqueue of a WebSocket control command
+
+        Superseded commands (pause/resume/status) are always accepted; only the latest of
+        each kind needs to reach the server. Any other command is never dropped once queued,
+        so it is refused (False) when the queue has no slot left for it.
+        """
         if not self.ws_loop or not self.ws_command_queue:
-            print("[Replace] WebSocket not ready; cannot send command yet")
-            return
+            logger.warning("[Replace] WebSocket not ready; cannot send command yet")
+            return False
+        kept = _SUPERSEDED_COMMANDS.get(payload.get("command")) is None
+        with self._command_lock:
+            if kept:
+                if self._unsent_kept_commands >= self.ws_command_queue.maxsize - _SUPERSEDED_SLOTS:
+                    logger.error("[WebSocket] Command queue full; %s refused", payload.get("command"))
+                    return False
+                self._unsent_kept_commands += 1
+            self._pending_commands.append(payload)
+            if self._command_wakeup_pending:
+                return True  # The drain already scheduled will pick this one up
+            self._command_wakeup_pending = True
         try:
-            self.ws_loop.call_soon_threadsafe(self.ws_command_queue.put_nowait, payload)
+            self.ws_loop.call_soon_threadsafe(self._drain_pending_commands)
         except Exception as e:
-            print(f"[Replace] Failed to enqueue command: {e}")
+            with self._command_lock:
+                self._command_wakeup_pending = False
+                self._pending_commands.remove(payload)
+                if kept:
+                    self._unsent_kept_commands -= 1
+            logger.error("[Replace] Failed to enqueue command: %s", e)
+            return False
+        return True
+
+    def _drain_pending_commands(self):
+        """WS-loop side of enqueue_ws_command: move every pending command onto the queue"""
+        with self._command_lock:
+            batch = list(self._pending_commands)
+            self._pending_commands.clear()
+            self._command_wakeup_pending = False
+        for payload in batch:
+            self._put_ws_command(payload)
+
+    def _put_ws_command(self, payload: dict):
+        """Queue one command for send_commands; a full queue sheds superseded commands first
+
+        enqueue_ws_command keeps _SUPERSEDED_SLOTS free of kept commands, so collapsing
+        pause/resume/status to the latest of each kind always leaves room.
+        """
+        command_queue = self.ws_command_queue
+        if command_queue.full():
+            batch = []
+            while not command_queue.empty():
+                batch.append(command_queue.get_nowait())
+            batch.append(payload)
+            kept = self._coalesce_commands(batch)
+            logger.warning("[WebSocket] Command queue full; dropped %d superseded commands",
+                           len(batch) - len(kept))
+            for cmd in kept:
+                command_queue.put_nowait(cmd)
+        else:
+            command_queue.put_nowait(payload)
 
     def on_pause_click(self):
         """Handle PAUSE button click"""
-        print("[Pause] Sending pause command to server")
+        logger.info("[Pause] Sending pause command to server")
         self.enqueue_ws_command({"command": "pause"})
         # Disable pause button, enable resume button
         self.pause_button.config(state=tk.DISABLED)
         self.resume_button.config(state=tk.NORMAL)
-        self.status_label.config(text="Status: ⏸  PAUSED")
+        self._run_state = "⏸  PAUSED"
+        self._render_status()
 
     def on_resume_click(self):
         """Handle RESUME button click"""
-        print("[Resume] Sending resume command to server")
+        logger.info("[Resume] Sending resume command to server")
         self.enqueue_ws_command({"command": "resume"})
         # Enable pause button, disable resume button
         self.pause_button.config(state=tk.NORMAL)
         self.resume_button.config(state=tk.DISABLED)
-        self.status_label.config(text="Status: ▶  RUNNING")
+        self._run_state = "▶  RUNNING"
+        self._render_status()
+
+    def _render_status(self):
+        """Rebuild the status line from the connection state and tick total"""
+        inputs = (self.connection_status, self._run_state, self._total_ticks)
+        if inputs == self._status_inputs:
+            return  # e.g. still retrying with no new ticks: skip the string rebuild
+        self._status_inputs = inputs
+        parts = [f"Status: {self.connection_status}"]
+        if self._run_state:
+            parts.append(self._run_state)
+        if self._total_ticks:
+            parts.append(f"{self._total_ticks} total ticks")
+        elif self.connection_status == STATUS_CONNECTED:
+            parts.append("Waiting for data...")
+        self._set_label(self.status_label, " | ".join(parts))
+
+    def _refresh_status(self):
+        """Periodic status refresh (replaces per-message after() closures from the WS thread)"""
+        self._render_status()
+        self.root.after(STATUS_REFRESH_MS, self._refresh_status)
 
     def handle_replace_symbol(self):
         """Handle replace button click"""
         old_symbol = self.symbol_var.get().strip().upper()
         if not old_symbol:
-            print("[Replace] No symbol selected")
+            logger.warning("[Replace] No symbol selected")
             return
 
         new_symbol = self.new_ticker_var.get().strip().upper()
         if not new_symbol:
-            print("[Replace] New ticker is empty")
+            logger.warning("[Replace] New ticker is empty")
             return
 
         if old_symbol == new_symbol:
-            print("[Replace] Symbol unchanged")
+            logger.warning("[Replace] Symbol unchanged")
             return
 
         # Find slot of old symbol
         try:
             slot = self.symbols.index(old_symbol)
         except ValueError:
-            print(f"[Replace] Symbol {old_symbol} not found")
+            logger.warning("[Replace] Symbol %s not found", old_symbol)
+            return
+
+        # Send command to server to update its active list; the slot keeps its old
+        # symbol unless the command is queued, so the UI never diverges from the server
+        if not self.enqueue_ws_command({"command": "replace_symbol", "slot": slot, "symbol": new_symbol}):
+            messagebox.showwarning("Replace Symbol",
+                                   f"Could not send the request to replace {old_symbol}; "
+                                   f"the slot still shows {old_symbol}. Try again once connected.")
             return
 
         # Update UI locally
         self.rebind_symbol_slot(slot, old_symbol, new_symbol)
 
-        # Send command to server to update its active list
-        self.enqueue_ws_command({"command": "replace_symbol", "slot": slot, "symbol": new_symbol})
-
-        print(f"[Replace] Requested swap: {old_symbol} -> {new_symbol}")
+        logger.info("[Replace] Requested swap: %s -> %s", old_symbol, new_symbol)
 
     def rebind_symbol_slot(self, slot: int, old_symbol: str, new_symbol: str):
         """Rebind UI data structures for a slot to a new symbol"""
@@ -147,50 +395,54 @@ class MultiSymbolDashboard:
         self.symbols[slot] = new_symbol
         self.symbol_combo['values'] = list(self.symbols)
 
-        # Update strategy manager mappings
-        self.strategy_manager.remove_symbol(old_symbol)
-        self.strategy_manager.add_symbol(new_symbol)
-
-        # Helper to reset dict entry
-        def reset_dict_entry(store, factory):
-            store.pop(old_symbol, None)
-            store[new_symbol] = factory()
-
-        # Reset data stores
-        reset_dict_entry(self.prices, lambda: deque(maxlen=MAX_DATA_POINTS))
-        reset_dict_entry(self.bid_prices, lambda: deque(maxlen=MAX_DATA_POINTS))
-        reset_dict_entry(self.ask_prices, lambda: deque(maxlen=MAX_DATA_POINTS))
-        reset_dict_entry(self.buy_signals, lambda: deque())
-        reset_dict_entry(self.sell_signals, lambda: deque())
-        reset_dict_entry(self.buy_close_signals, lambda: deque())
-        reset_dict_entry(self.sell_close_signals, lambda: deque())
-        reset_dict_entry(self.tick_counts, lambda: 0)
-        reset_dict_entry(self.trade_counters, lambda: 0)
+        # The WS thread may be mid-tick on these stores; swap them under the lock
+        with self._data_lock:
+            # Update strategy manager mappings
+            self.strategy_manager.remove_symbol(old_symbol)
+            self.strategy_manager.add_symbol(new_symbol)
+            self._strategies.pop(old_symbol.upper(), None)
+            self._opening_ranges.pop(old_symbol.upper(), None)
+            strategy = self.strategy_manager.get_strategy(new_symbol)
+            self._strategies[new_symbol.upper()] = strategy
+            self._opening_ranges[new_symbol.upper()] = getattr(strategy, 'opening_range', None)
+
+            # Helper to hand the slot's preallocated buffer to the new symbol
+            def reuse_buffer(store, factory):
+                buf = store.pop(old_symbol, None)
+                if buf is None:
+                    buf = factory()
+                else:
+                    buf.clear()
+                store[new_symbol] = buf
+
+            # Reset data stores
+            reuse_buffer(self.symbol_state, SymbolState)
+            reuse_buffer(self.buy_signals, partial(SignalBuffer, MAX_DATA_POINTS))
+            reuse_buffer(self.sell_signals, partial(SignalBuffer, MAX_DATA_POINTS))
+            reuse_buffer(self.buy_close_signals, partial(SignalBuffer, MAX_DATA_POINTS))
+            reuse_buffer(self.sell_close_signals, partial(SignalBuffer, MAX_DATA_POINTS))
 
         # Move chart/stat widgets to new key and retitle
+        self._stale_charts.discard(old_symbol)
         if old_symbol in self.chart_frames:
             self.chart_frames[new_symbol] = self.chart_frames.pop(old_symbol)
-            # No more chart title - instead update the stats line at the top
-            self.chart_frames[new_symbol]['canvas'].draw()
+            self.chart_frames[new_symbol]['ax'].set_title(f"{new_symbol} Price Chart")
+            self.chart_frames[new_symbol]['background'] = None  # Title is baked into the background
 
         if old_symbol in self.stat_labels:
-            self.stat_labels[new_symbol] = self.stat_labels.pop(old_symbol)
-            self.stat_labels[new_symbol]['price'].config(text="Price: --")
-            self.stat_labels[new_symbol]['pnl'].config(text="P/L: --")
-            self.stat_labels[new_symbol]['trades'].config(text="Trades: 0")
-            self.stat_labels[new_symbol]['open'].config(text="Open: --")
-            self.stat_labels[new_symbol]['close'].config(text="Close: --")
-            self.stat_labels[new_symbol]['range_status'].config(text="Range: --")
-            self.stat_labels[new_symbol]['range_level'].config(text="--")
-
-        if old_symbol in self.event_texts:
-            self.event_texts[new_symbol] = self.event_texts.pop(old_symbol)
-            self.event_texts[new_symbol].delete('1.0', tk.END)
-            self.event_texts[new_symbol].insert(tk.END, f"Swapped to {new_symbol}\n")
-
-        # Force immediate redraw/clear of chart
+            stats = self.stat_labels[new_symbol] = self.stat_labels.pop(old_symbol)
+            self._set_label(stats['price'], "Price: --")
+            self._set_label(stats['pnl'], "P/L: --")
+            self._set_label(stats['trades'], "Trades: 0")
+            self._set_label(stats['open'], "Open: --")
+            self._set_label(stats['close'], "Close: --")
+            self._set_label(stats['range_status'], "Range: --")
+            self._set_label(stats['range_level'], "--")
+
+        # Clear the chart in the next coalesced redraw pass
+        self._dirty_symbols.discard(old_symbol)
         if new_symbol in self.chart_frames:
-            self.update_chart(new_symbol)
+            self._schedule_redraw(new_symbol)
     
     def setup_ui(self):
         """Setup the UI with 10x2 grid layout (scrollable)"""
@@ -232,7 +484,15 @@ class MultiSymbolDashboard:
             "<Configure>",
             lambda e: canvas.itemconfig(canvas_window, width=e.width)
         )
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Every view change (scroll, drag, resize) reports here; catch up charts scrolled into view
+        def _on_yview(first, last):
+            scrollbar.set(first, last)
+            if self._stale_charts:
+                self._refresh_visible_charts()
+        canvas.configure(yscrollcommand=_on_yview)
+        self._grid_canvas = canvas
+        # Restoring a minimised window maps the root again; catch up charts skipped meanwhile
+        self.root.bind('<Map>', self._on_root_mapped, add='+')
         
         # Configure mousewheel scrolling
         def _on_mousewheel(event):
@@ -342,445 +602,525 @@ class MultiSymbolDashboard:
         chart_subframe = ttk.Frame(frame)
         chart_subframe.pack(fill=tk.BOTH, expand=True)
         
-        # Create figure without title
         fig = Figure(figsize=(6, 4), dpi=100)
         ax = fig.add_subplot(111)
-        ax.set_xlabel("Time (Events)")
+        ax.set_title(f"{symbol} Price Chart")
+        ax.set_xlabel("Time")
         ax.set_ylabel("Price ($)")
         ax.grid(True, alpha=0.3)
+        # Force plain number formatting (no scientific notation); configured once here since
+        # ticklabel_format() would only restyle whichever formatter is installed at the time
+        y_formatter = ScalarFormatter(useOffset=False)
+        y_formatter.set_scientific(False)
+        ax.yaxis.set_major_formatter(y_formatter)
+        # Fixed margins instead of re-running tight_layout() on every redraw
+        fig.subplots_adjust(left=0.14, right=0.97, top=0.91, bottom=0.12)
+        
+        # Persistent artists; update_chart only swaps their data
+        price_line, = ax.plot([], [], label="Price", color="#2E7D32", linewidth=2.5, alpha=0.9)
+        price_dots = ax.scatter([], [], color="#2E7D32", s=12, alpha=0.6, zorder=5)
+        markers = {key: ax.scatter([], [], **style) for key, style in _MARKER_STYLES.items()}
+        legend = ax.legend(handles=[price_line, markers['buy'], markers['sell'], markers['buy_close']],
+                           loc='upper left', fontsize=8)
+        # Live artists are left out of full draws and blitted over the cached background
+        # (after the legend, which copies its handles' properties). They are painted in the
+        # order a full draw would use (zorder), with the legend last so it stays on top.
+        animated = sorted((price_line, price_dots, *markers.values()), key=lambda artist: artist.get_zorder())
+        animated.append(legend)
+        for artist in animated:
+            artist.set_animated(True)
         
         # Embed matplotlib
         canvas = FigureCanvasTkAgg(fig, master=chart_subframe)
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas_widget = canvas.get_tk_widget()
+        canvas_widget.pack(fill=tk.BOTH, expand=True)
         
-        self.chart_frames[symbol] = {
+        chart = {
             'frame': frame,
             'canvas': canvas,
             'fig': fig,
-            'ax': ax
+            'ax': ax,
+            'price_line': price_line,
+            'price_dots': price_dots,
+            **markers,  # 'buy', 'sell', 'buy_close', 'sell_close'
+            'animated': animated,
+            'background': None,  # Static pixels from the last full draw; None forces a full draw
+            'limits': None,  # (xlim, ylim) baked into background
         }
+        self.chart_frames[symbol] = chart
+        canvas.mpl_connect('draw_event', partial(self._on_chart_drawn, chart))
+        # A resize makes the cached background the wrong size: drop it until the backend's redraw
+        canvas_widget.bind('<Configure>', partial(self._on_chart_resized, chart), add='+')
+        frame.bind('<Map>', partial(self._on_chart_mapped, frame))
+    
+    @staticmethod
+    def _on_chart_resized(chart, event=None):
+        """Canvas resized: never blit over the old-size background; the next update draws in full"""
+        chart['background'] = None
+    
+    @staticmethod
+    def _on_chart_drawn(chart, event=None):
+        """After a full draw (redraw, resize): cache the static background, paint the live artists"""
+        chart['background'] = chart['canvas'].copy_from_bbox(chart['fig'].bbox)
+        ax = chart['ax']
+        for artist in chart['animated']:
+            ax.draw_artist(artist)
+    
+    def _on_chart_mapped(self, frame, event=None):
+        """Catch up a chart that skipped redraws while it was hidden"""
+        for symbol in list(self._stale_charts):
+            if self.chart_frames.get(symbol, {}).get('frame') is frame:
+                self.update_chart(symbol)
+    
+    def _on_root_mapped(self, event):
+        """Window restored: redraw visible charts that went stale while it was minimised"""
+        if event.widget is self.root and self._stale_charts:
+            self._refresh_visible_charts()
+    
+    def _chart_in_view(self, frame):
+        """True when the chart frame overlaps the visible part of the scrollable grid"""
+        canvas = self._grid_canvas
+        if canvas is None:
+            return True
+        top = canvas.canvasy(0)
+        y = frame.winfo_y()
+        return y < top + canvas.winfo_height() and y + frame.winfo_height() > top
+    
+    def _refresh_visible_charts(self):
+        """Redraw stale charts that the grid has just scrolled into view"""
+        for symbol in list(self._stale_charts):
+            chart = self.chart_frames.get(symbol)
+            if chart is not None and self._chart_in_view(chart['frame']):
+                self.update_chart(symbol)
+    
+    def _set_label(self, label, text, foreground=None):
+        """Configure a label only when its text/colour differs from the last write"""
+        state = (text, foreground)
+        if self._label_state.get(label) == state:
+            return
+        self._label_state[label] = state
+        if foreground is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, foreground=foreground)
+    
+    @staticmethod
+    def _visible_signals(signals, oldest_tick_idx):
+        """Scatter offsets (x relative to the chart window, price) for signals inside it"""
+        signals.prune_before(oldest_tick_idx)
+        lo, hi = signals.lo, signals.hi
+        offsets = np.empty((hi - lo, 2))  # Filled in place: no column_stack copy per marker type
+        np.subtract(signals.idx[lo:hi], oldest_tick_idx, out=offsets[:, 0])
+        offsets[:, 1] = signals.price[lo:hi]
+        return offsets
     
     def update_chart(self, symbol):
         """Update chart for a specific symbol"""
         if symbol not in self.chart_frames:
-            print(f"[update_chart] {symbol}: Not in chart_frames")
+            logger.debug("[update_chart] %s: Not in chart_frames", symbol)
             return
         
-        print(f"[update_chart] {symbol}: Updating chart with {len(self.prices[symbol])} prices")
-        
-        ax = self.chart_frames[symbol]['ax']
-        ax.clear()
-        # Force plain number formatting (no scientific notation)
-        ax.ticklabel_format(style='plain', axis='y')
-        ax.yaxis.set_major_formatter(ScalarFormatter(useOffset=False))
+        chart = self.chart_frames[symbol]
+        # Hidden or scrolled-away charts only get marked stale; <Map>/scrolling redraws them
+        frame = chart['frame']
+        if not frame.winfo_ismapped() or not self._chart_in_view(frame):
+            self._stale_charts.add(symbol)
+            return
+        self._stale_charts.discard(symbol)
         
-        if len(self.prices[symbol]) > 0:
-            x_data = list(range(len(self.prices[symbol])))
+        # Snapshot the buffers under the lock; the WS thread keeps appending
+        with self._data_lock:
+            state = self.symbol_state[symbol]
+            prices = state.prices
+            num_current_prices = len(prices)
+            prices_arr = prices.view().copy()  # Artists keep a reference; the ring keeps moving
             
             # Calculate the offset: how many ticks were received before the current window started
-            num_current_prices = len(self.prices[symbol])
-            oldest_tick_idx = self.tick_counts[symbol] - num_current_prices
-            
-            # Plot price line with smooth curved spline interpolation
-            prices_list = list(self.prices[symbol])
-            if len(x_data) > 3:
-                # Use spline for smooth curves
-                spl = make_interp_spline(x_data, prices_list, k=3)
-                x_smooth = np.linspace(min(x_data), max(x_data), 300)
-                y_smooth = spl(x_smooth)
-                ax.plot(x_smooth, y_smooth, label="Price", 
-                       color="#2E7D32", linewidth=2.5, alpha=0.9)
-                ax.scatter(x_data, prices_list, color="#2E7D32", s=12, alpha=0.6, zorder=5)
-            else:
-                ax.plot(x_data, prices_list, label="Price", 
-                       color="#2E7D32", linewidth=2.5, marker='o', markersize=3, alpha=0.8)
-            
-            print(f"[update_chart] {symbol}: Plotted {len(x_data)} price points (oldest tick idx: {oldest_tick_idx})")
-            
-            # Plot BUY signals (filter by visible range and convert to relative x)
-            if self.buy_signals[symbol]:
-                visible_buy = [(abs_idx, p, tid) for abs_idx, p, tid in self.buy_signals[symbol] 
-                               if oldest_tick_idx <= abs_idx < self.tick_counts[symbol]]
-                if visible_buy:
-                    buy_x = [abs_idx - oldest_tick_idx for abs_idx, p, tid in visible_buy]
-                    buy_y = [p for abs_idx, p, tid in visible_buy]
-                    ax.scatter(buy_x, buy_y, marker='^', color='#00D084', s=200, 
-                              label="BUY", zorder=5, edgecolors='darkgreen', linewidths=1)
-                    print(f"[update_chart] {symbol}: Plotted {len(buy_x)} BUY signals")
-            
-            # Plot SELL signals
-            if self.sell_signals[symbol]:
-                visible_sell = [(abs_idx, p, tid) for abs_idx, p, tid in self.sell_signals[symbol] 
-                                if oldest_tick_idx <= abs_idx < self.tick_counts[symbol]]
-                if visible_sell:
-                    sell_x = [abs_idx - oldest_tick_idx for abs_idx, p, tid in visible_sell]
-                    sell_y = [p for abs_idx, p, tid in visible_sell]
-                    ax.scatter(sell_x, sell_y, marker='v', color='#FF6B6B', s=200, 
-                              label="SELL", zorder=5, edgecolors='darkred', linewidths=1)
-                    print(f"[update_chart] {symbol}: Plotted {len(sell_x)} SELL signals")
-            
-            # Plot close signals
-            if self.buy_close_signals[symbol]:
-                visible_close = [(abs_idx, p, tid) for abs_idx, p, tid in self.buy_close_signals[symbol] 
-                                 if oldest_tick_idx <= abs_idx < self.tick_counts[symbol]]
-                if visible_close:
-                    close_x = [abs_idx - oldest_tick_idx for abs_idx, p, tid in visible_close]
-                    close_y = [p for abs_idx, p, tid in visible_close]
-                    ax.scatter(close_x, close_y, marker='X', color='#00AA55', s=150, 
-                              label="CLOSE", zorder=4, edgecolors='darkgreen', linewidths=1, alpha=0.7)
-            
-            if self.sell_close_signals[symbol]:
-                visible_close = [(abs_idx, p, tid) for abs_idx, p, tid in self.sell_close_signals[symbol] 
-                                 if oldest_tick_idx <= abs_idx < self.tick_counts[symbol]]
-                if visible_close:
-                    close_x = [abs_idx - oldest_tick_idx for abs_idx, p, tid in visible_close]
-                    close_y = [p for abs_idx, p, tid in visible_close]
-                    ax.scatter(close_x, close_y, marker='X', color='#CC4444', s=150, 
-                              label="CLOSE", zorder=4, edgecolors='darkred', linewidths=1, alpha=0.7)
+            oldest_tick_idx = state.tick_count - num_current_prices
             
-            ax.legend(loc='upper left', fontsize=8)
-            ax.set_title(f"{symbol} Price Chart")
-            ax.set_xlabel("Time")
-            ax.set_ylabel("Price ($)")
-            ax.grid(True, alpha=0.3)
+            # Trade markers (filter by visible range and convert to relative x)
+            markers = [(key, self._visible_signals(signals[symbol], oldest_tick_idx))
+                       for key, signals in self._marker_stores]
+            extrema = state.extrema
+            price_min, price_max = extrema.min, extrema.max
+        
+        # Artists persist between redraws; only their data changes
+        x_data = np.arange(num_current_prices)
+        
+        # Plain polyline: at <= MAX_DATA_POINTS points a spline adds nothing visible
+        chart['price_line'].set_data(x_data, prices_arr)
+        chart['price_dots'].set_offsets(np.column_stack((x_data, prices_arr)))
+        for key, offsets in markers:
+            chart[key].set_offsets(offsets)
+        
+        ax = chart['ax']
+        canvas = chart['canvas']
+        limits = chart['limits']
+        if num_current_prices:
+            xlim = (-0.5, max(num_current_prices - 1, 1) + 0.5)
+            ylim = limits[1] if limits else None
             
-            # Set y-axis limits
-            if self.prices[symbol]:
-                price_min = min(self.prices[symbol])
-                price_max = max(self.prices[symbol])
+            # Set y-axis limits from the running window extrema
+            if price_min is not None:
                 padding = (price_max - price_min) * 0.1 if price_max != price_min else 1
-                ax.set_ylim(price_min - padding, price_max + padding)
-        else:
-            print(f"[update_chart] {symbol}: No prices to plot yet")
+                ylim = (price_min - padding, price_max + padding)
+            limits = (xlim, ylim)
         
-        self.chart_frames[symbol]['fig'].tight_layout()
-        self.chart_frames[symbol]['canvas'].draw()
-        print(f"[update_chart] {symbol}: Canvas drawn")
+        if chart['background'] is None or limits != chart['limits']:
+            # Axes changed: full redraw in Tk's idle pass; draw_event recaches the background
+            if limits is not None:
+                ax.set_xlim(*limits[0])
+                if limits[1] is not None:
+                    ax.set_ylim(*limits[1])
+            chart['limits'] = limits
+            chart['background'] = None
+            canvas.draw_idle()
+        else:
+            # Same axes: repaint only the live artists over the cached background
+            canvas.restore_region(chart['background'])
+            for artist in chart['animated']:
+                ax.draw_artist(artist)
+            canvas.blit(ax.bbox.padded(1))  # Line edges antialias onto the spine pixels just outside
+    
+    def _schedule_redraw(self, *symbols):
+        """Mark symbols dirty and arm a single redraw pass for all of them"""
+        self._dirty_symbols.update(symbols)
+        if self._dirty_symbols and not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.root.after(REDRAW_INTERVAL_MS, self._flush_redraws)
     
-    def update_ui(self, data):
-        """Update UI with multi-symbol data from WebSocket"""
+    def _flush_redraws(self):
+        """Redraw each dirty chart once, however many ticks arrived since the last pass"""
+        self._redraw_scheduled = False
+        dirty, self._dirty_symbols = self._dirty_symbols, set()
+        if self.root.state() == 'iconic':
+            # Minimised: nothing is on screen, so only mark the charts stale until <Map>
+            self._stale_charts.update(dirty & self.chart_frames.keys())
+            return
+        for symbol in dirty:
+            self.update_chart(symbol)
+    
+    def _ingest_snapshot(self, data):
+        """Run a snapshot through the strategies on the WS thread and queue the UI state for Tk"""
         try:
             symbols_data = data.get("symbols", {})
-            print(f"\n[update_ui] Received snapshot with {len(symbols_data)} symbols: {list(symbols_data.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[_ingest_snapshot] Received snapshot with %s symbols: %s", len(symbols_data), list(symbols_data))
+            
+            views = {}
+            for symbol, snapshot in symbols_data.items():
+                symbol = symbol.upper()
+                logger.debug("[_ingest_snapshot] Processing %s...", symbol)
+                view = self._process_symbol_tick(symbol, snapshot)
+                if view is not None:
+                    views[symbol] = view
             
+            # Portfolio totals in one pass over every strategy, not just the symbols in this frame
             total_pnl = 0
             total_trades = 0
             open_positions = 0
-            
-            for symbol, snapshot in symbols_data.items():
-                print(f"[update_ui] Processing {symbol}...")
-                self._process_symbol_tick(symbol, snapshot)
-                
-                # Calculate metrics - sum up all symbols' P/L and trades
-                strategy = self.strategy_manager.get_strategy(symbol)
+            for symbol, strategy in list(self._strategies.items()):
                 if strategy:
                     metrics = strategy.metrics
-                    # Accumulate P/L and trades from this symbol's strategy
                     total_pnl += metrics.total_pnl
                     total_trades += metrics.total_trades
-                    # Check if symbol has open position
                     if symbol in strategy.current_positions:
                         open_positions += 1
             
-            # Update global stats with calculated totals from all symbols' local strategies
-            pnl_color = "green" if total_pnl >= 0 else "red"
-            self.global_pnl_label.config(text=f"Total P/L: ${total_pnl:+.2f}", foreground=pnl_color)
-            self.global_trades_label.config(text=f"Trades: {total_trades}")
-            self.open_positions_label.config(text=f"Open Positions: {open_positions}/{len(self.symbols)}")
-            
-            print(f"[update_ui] DONE - Total P/L: ${total_pnl:+.2f}, Trades: {total_trades}, Open Positions: {open_positions}\n")
+            self._ui_queue.append((views, total_pnl, total_trades, open_positions))
+            logger.debug("[_ingest_snapshot] DONE - Total P/L: $%+.2f, Trades: %s, Open Positions: %s", total_pnl, total_trades, open_positions)
         
         except Exception as e:
-            print(f"[ERROR] update_ui: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[ERROR] _ingest_snapshot: %s", e)
+    
+    def _drain_ui_queue(self):
+        """Tk side: apply UI state queued by the WS thread, coalesced per symbol"""
+        try:
+            ui_queue = self._ui_queue
+            if ui_queue:
+                # Later snapshots overwrite earlier label state
+                labels_by_symbol = {}
+                totals = None
+                while ui_queue:
+                    views, *totals = ui_queue.popleft()
+                    for symbol, labels in views.items():
+                        labels_by_symbol.setdefault(symbol, {}).update(labels)
+                
+                for symbol, labels in labels_by_symbol.items():
+                    stats = self.stat_labels.get(symbol)
+                    if stats is None:
+                        continue  # Slot was rebound after the snapshot was processed
+                    for key, (text, foreground) in labels.items():
+                        self._set_label(stats[key], text, foreground)
+                
+                # Update global stats with calculated totals from all symbols' local strategies
+                total_pnl, total_trades, open_positions = totals
+                pnl_color = "green" if total_pnl >= 0 else "red"
+                self._set_label(self.global_pnl_label, f"Total P/L: ${total_pnl:+.2f}", pnl_color)
+                self._set_label(self.global_trades_label, f"Trades: {total_trades}")
+                self._set_label(self.open_positions_label, f"Open Positions: {open_positions}/{len(self.symbols)}")
+                
+                self._schedule_redraw(*labels_by_symbol.keys() & self.chart_frames.keys())
+        except Exception as e:
+            logger.exception("[ERROR] _drain_ui_queue: %s", e)
+        finally:
+            trade_events = self._trade_events
+            while trade_events:
+                self.handle_trade_event(trade_events.popleft())  # Catches its own errors
+            self.root.after(UI_POLL_MS, self._drain_ui_queue)
     
     def _process_symbol_tick(self, symbol, snapshot):
-        """Process tick for one symbol"""
-        symbol = symbol.upper()
-        
-        if symbol not in self.prices:
-            print(f"[_process_symbol_tick] Symbol {symbol} not in prices dict (available: {list(self.prices.keys())})")
-            return
+        """Process tick for one symbol off the Tk thread
+
+        _data_lock is held only around SymbolState and signal buffer access, so Tk never
+        waits on the strategy or order submission. If Tk rebinds the slot while the
+        strategy runs, the SymbolState changes hands and the rest of the tick is dropped.
+
+        Returns labels for the Tk side, mapping stat-label keys to (text, foreground);
+        None when there is nothing to show.
+        """
+        labels = {}
         
         try:
-            ticker = snapshot.get("ticker", {})
-            day = ticker.get("day", {})
-            minute = ticker.get("min", {})
-            prev_day = ticker.get("prevDay", {})
-            
             # Try to get price: minute > day > prevDay (fallback to yesterday's close if market closed)
-            price = minute.get("c") or day.get("c") or prev_day.get("c")
-            if price is None or price == 0:
-                print(f"[_process_symbol_tick] {symbol}: No price found in snapshot")
-                return
-            
-            print(f"[_process_symbol_tick] {symbol}: Processing price ${price:.2f}")
+            price, volume, updated_ns = _extract_quote(snapshot)
             
-            volume = minute.get("v") or day.get("v") or prev_day.get("v") or 0
-            bid = round(price - 0.01, 2)
-            ask = round(price + 0.01, 2)
-            updated_ns = ticker.get("updated") or int(time.time() * 1e9)
+            with self._data_lock:
+                state = self.symbol_state.get(symbol)
+                if state is None:
+                    logger.warning("[_process_symbol_tick] Symbol %s not in symbol_state (available: %s)", symbol, list(self.symbol_state))
+                    return
+                if price is None:
+                    logger.debug("[_process_symbol_tick] %s: No price found in snapshot", symbol)
+                    return
+                
+                # Update prices
+                state.prices.append(price)
+                state.extrema.append(price)
+                tick_idx = state.tick_count
+                state.tick_count = tick_idx + 1
+                self._total_ticks += 1
+                strategy = self._strategies.get(symbol)
+                opening_range = self._opening_ranges.get(symbol)
             
-            # Update prices
-            window_full = len(self.prices[symbol]) == self.prices[symbol].maxlen
-            self.prices[symbol].append(price)
-            self.bid_prices[symbol].append(bid)
-            self.ask_prices[symbol].append(ask)
-            self.tick_counts[symbol] += 1
+            logger.debug("[_process_symbol_tick] %s: Processed price $%.2f. Tick count: %s", symbol, price, tick_idx + 1)
             
-            print(f"[_process_symbol_tick] {symbol}: Added price to deque. Tick count: {self.tick_counts[symbol]}")
+            updated_ns = updated_ns or time.time_ns()  # Integer clock: no float multiply/int() per tick
             
             # Create tick and process through strategy
             tick = Tick(price=price, volume=volume, timestamp_ns=updated_ns, symbol=symbol)
-            event = self.strategy_manager.process_tick(symbol, tick)
-            
-            print(f"[_process_symbol_tick] {symbol}: Strategy event: {event.get('action')} - {event.get('reason')}")
+            if strategy is None:
+                logger.debug("[_process_symbol_tick] %s: No strategy for symbol, skipping", symbol)
+                return
+            event = strategy.process_tick(tick)
 
-            # If strategy unknown or no metrics, skip logging/stat updates
-            if event is None or event.get('reason') == 'unknown_symbol' or 'metrics' not in event:
-                print(f"[_process_symbol_tick] {symbol}: Skipping stats/log (unknown symbol or missing metrics)")
+            # If no metrics, skip logging/stat updates
+            if event is None or 'metrics' not in event:
+                logger.debug("[_process_symbol_tick] %s: Skipping stats/log (missing metrics)", symbol)
                 return
             
-            # Log tick
-            self.logger.log_tick(tick, event)
+            # Debug arguments below cost dict lookups/copies; build them only when they will be emitted
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("[_process_symbol_tick] %s: Strategy event: %s - %s", symbol, event.get('action'), event.get('reason'))
             
-            # Handle trade signals
-            if event.get("action") == "OPEN":
-                trade = event.get("trade")
-                if trade and hasattr(trade, 'entry_price') and trade.entry_price is not None:
-                    self.trade_counters[symbol] += 1
-                    print(f"[_process_symbol_tick] {symbol}: OPEN signal - trade #{self.trade_counters[symbol]}")
-                    
-                    # Cache the entry price for this symbol and clear previous close price
-                    entry_price = trade.entry_price
-                    self.open_prices[symbol] = entry_price
-                    self.close_prices[symbol] = None  # Clear previous close price when new position opens
-                    print(f"[_process_symbol_tick] {symbol}: Set open_prices[{symbol}] = ${entry_price:.2f}, cleared close_prices")
-                    
-                    # Update UI Open label with thread-safe call
-                    def update_open_label(ep=entry_price, sym=symbol):
-                        try:
-                            label_text = f"Open: ${ep:.2f}"
-                            print(f"[update_open_label] Updating {sym} Open label to: {label_text}")
-                            self.stat_labels[sym]['open'].config(text=label_text, foreground="green")
-                            # Clear the Close label when new position opens
-                            self.stat_labels[sym]['close'].config(text="Close: --")
-                            print(f"[update_open_label] ✅ Updated Open label for {sym} to: {label_text}, cleared Close")
-                        except Exception as e:
-                            print(f"[update_open_label] ERROR: {e}")
-                            import traceback
-                            traceback.print_exc()
-                    
-                    self.root.after(0, update_open_label)
-                    
-                    if trade.direction == "LONG":
-                        self.buy_signals[symbol].append((self.tick_counts[symbol]-1, price, self.trade_counters[symbol]))
-                        
-                        # Execute BUY trade on Trading212
-                        if self.trading212_broker:
-                            asyncio.create_task(self.trading212_broker.execute_open_trade(
-                                symbol=symbol,
-                                entry_price=price,
-                                quantity=1.0
-                            ))
-                            print(f"[_process_symbol_tick] {symbol}: Trading212 BUY order queued")
-                    
-                    elif trade.direction == "SHORT":
-                        self.sell_signals[symbol].append((self.tick_counts[symbol]-1, price, self.trade_counters[symbol]))
+            # Log tick (written by the background log thread)
+            self._enqueue_tick_log(tick, event)
             
-            if event.get("action") == "CLOSE":
-                trade = event.get("trade")
-                if trade and hasattr(trade, 'exit_price') and trade.exit_price is not None:
-                    print(f"[_process_symbol_tick] {symbol}: CLOSE signal - P/L: ${trade.pnl:.3f}")
-                    
-                    # Cache the close price (exit price) for this symbol
-                    exit_price = trade.exit_price
-                    entry_price = trade.entry_price
-                    self.close_prices[symbol] = exit_price
-                    print(f"[_process_symbol_tick] {symbol}: Set close_prices[{symbol}] = ${exit_price:.2f}")
-                    
-                    # Update UI labels with thread-safe call - show both Open and Close prices
-                    def update_close_labels(exit_p=exit_price, ep=entry_price, sym=symbol):
-                        try:
-                            print(f"[update_close_labels] Updating {sym} Close label")
-                            self.stat_labels[sym]['close'].config(text=f"Close: ${exit_p:.2f}", foreground="red")
-                            print(f"[update_close_labels] Close label updated to: Close: ${exit_p:.2f}")
-                            # Keep showing the open price (cached) - don't clear it
-                            self.stat_labels[sym]['open'].config(text=f"Open: ${ep:.2f}", foreground="green")
-                            print(f"[update_close_labels] Open label kept at: Open: ${ep:.2f}")
-                            print(f"  ✅ Updated Close label for {sym} to: ${exit_p:.2f}, Open cached: ${ep:.2f}")
-                        except Exception as e:
-                            print(f"[update_close_labels] ERROR: {e}")
-                            import traceback
-                            traceback.print_exc()
-                    
-                    self.root.after(0, update_close_labels)
-                    
-                    trade_id = self.trade_counters[symbol]
-                    if trade.direction == "LONG":
-                        self.buy_close_signals[symbol].append((self.tick_counts[symbol]-1, trade.exit_price, trade_id))
-                        
-                        # Execute SELL to close position on Trading212
-                        if self.trading212_broker:
-                            asyncio.create_task(self.trading212_broker.execute_close_trade(
-                                symbol=symbol,
-                                exit_price=trade.exit_price,
-                                exit_reason=trade.exit_reason
-                            ))
-                            print(f"[_process_symbol_tick] {symbol}: Trading212 SELL order queued ({trade.exit_reason})")
-                    
-                    elif trade.direction == "SHORT":
-                        self.sell_close_signals[symbol].append((self.tick_counts[symbol]-1, trade.exit_price, trade_id))
-                    
-                    self.log_event(symbol, trade)
+            action = event.get("action")
+            trade = event.get("trade")
+            metrics = strategy.metrics
+            pnl = metrics.total_pnl
+            total_trades = metrics.total_trades
+            position = strategy.current_positions.get(symbol)
+            order = None  # (method, kwargs) submitted once the lock is released
             
-            # Update stats
-            strategy = self.strategy_manager.get_strategy(symbol)
-            if strategy:
-                metrics = strategy.metrics
-                pnl = metrics.total_pnl
+            with self._data_lock:
+                if self.symbol_state.get(symbol) is not state:
+                    logger.debug("[_process_symbol_tick] %s: Slot rebound during the tick, dropping it", symbol)
+                    return
                 
-                print(f"[_process_symbol_tick] {symbol}: Updating UI labels - Price: ${price:.2f}, P/L: ${pnl:.2f}")
+                # Handle trade signals
+                if action == "OPEN":
+                    if trade and hasattr(trade, 'entry_price') and trade.entry_price is not None:
+                        trade_id = state.trade_counter + 1
+                        state.trade_counter = trade_id
+                        logger.info("[_process_symbol_tick] %s: OPEN signal - trade #%s", symbol, trade_id)
+                        
+                        # Cache the entry price for this symbol and clear previous close price
+                        entry_price = trade.entry_price
+                        state.open_price = entry_price
+                        state.close_price = None  # Clear previous close price when new position opens
+                        logger.debug("[_process_symbol_tick] %s: Set open_price = $%.2f, cleared close_price", symbol, entry_price)
+                        
+                        if trade.direction == "LONG":
+                            self.buy_signals[symbol].append(tick_idx, price, trade_id)
+                            # Execute BUY trade on Trading212
+                            order = ("execute_open_trade", dict(symbol=symbol, entry_price=price, quantity=1.0))
+                        
+                        elif trade.direction == "SHORT":
+                            self.sell_signals[symbol].append(tick_idx, price, trade_id)
                 
-                self.stat_labels[symbol]['price'].config(text=f"Price: ${price:.2f}")
-                self.stat_labels[symbol]['pnl'].config(text=f"P/L: ${pnl:+.2f}")
-                self.stat_labels[symbol]['trades'].config(text=f"Trades: {metrics.total_trades}")
-                # Update range information
-                if hasattr(strategy, 'opening_range'):
-                    print(f"[update_ui] {symbol}: strategy.opening_range exists, keys={list(strategy.opening_range.keys())}")
-                    if symbol in strategy.opening_range:
-                        or_data = strategy.opening_range[symbol]
-                        phase = or_data.get("phase", "N/A")
+                elif action == "CLOSE":
+                    if trade and hasattr(trade, 'exit_price') and trade.exit_price is not None:
+                        logger.info("[_process_symbol_tick] %s: CLOSE signal - P/L: $%.3f", symbol, trade.pnl)
                         
-                        if phase == "BUILDING":
-                            ticks = or_data.get("ticks", 0)
-                            total_ticks = strategy.opening_range_ticks
-                            build_pct = (ticks / total_ticks * 100) if total_ticks > 0 else 0
-                            range_low = or_data.get("low", 0)
-                            range_high = or_data.get("high", 0)
-                            
-                            print(f"[update_ui] 🏗️  {symbol} BUILDING: {ticks}/{total_ticks} ticks ({build_pct:.0f}%) | Range: ${range_low:.4f}-${range_high:.4f}")
-                            print(f"[update_ui] {symbol} DEBUG: or_data keys = {or_data.keys()}, initialized={or_data.get('initialized')}")
-                            
-                            self.stat_labels[symbol]['range_status'].config(
-                                text=f"Building ({ticks}/{total_ticks})",
-                                foreground="orange"
-                            )
-                            self.stat_labels[symbol]['range_level'].config(
-                                text=f"${range_low:.4f} - ${range_high:.4f} ({build_pct:.0f}%)"
-                            )
+                        # Cache the close price (exit price) for this symbol
+                        exit_price = trade.exit_price
+                        state.close_price = exit_price
+                        logger.debug("[_process_symbol_tick] %s: Set close_price = $%.2f", symbol, exit_price)
                         
-                        elif phase == "LOCKED":
-                            range_low = or_data.get("low", 0)
-                            range_high = or_data.get("high", 0)
-                            position_locked = or_data.get("position_locked", False)
-                            validity_expires = or_data.get("validity_expires_at", 0)
-                            
-                            import time as time_module
-                            now = time_module.time()
-                            time_left = max(0, validity_expires - now)
-                            
-                            print(f"[update_ui] 🔒 {symbol} LOCKED: ${range_low:.4f}-${range_high:.4f} | position_locked={position_locked}, time_left={time_left:.0f}s")
-                            
-                            if position_locked:
-                                status_text = "LOCKED (Position Open)"
-                                color = "purple"
-                            else:
-                                mins_left = time_left / 60
-                                status_text = f"LOCKED ({mins_left:.1f}m)"
-                                color = "green" if time_left > 300 else "orange" if time_left > 60 else "red"
-                            
-                            self.stat_labels[symbol]['range_status'].config(
-                                text=status_text,
-                                foreground=color
-                            )
-                            self.stat_labels[symbol]['range_level'].config(
-                                text=f"${range_low:.4f} - ${range_high:.4f}"
-                            )
-                        else:
-                            print(f"[update_ui] ❌ {symbol} Phase N/A or unknown: {phase}")
-                            self.stat_labels[symbol]['range_status'].config(text="Range: --", foreground="gray")
-                            self.stat_labels[symbol]['range_level'].config(text="--")
-                    else:
-                        print(f"[update_ui] {symbol}: NOT in strategy.opening_range")
-                else:
-                    print(f"[update_ui] {symbol}: strategy.opening_range attribute does NOT exist!")
+                        trade_id = state.trade_counter
+                        if trade.direction == "LONG":
+                            self.buy_close_signals[symbol].append(tick_idx, exit_price, trade_id)
+                            # Execute SELL to close position on Trading212
+                            order = ("execute_close_trade", dict(symbol=symbol, exit_price=exit_price,
+                                                                 exit_reason=trade.exit_reason))
+                        
+                        elif trade.direction == "SHORT":
+                            self.sell_close_signals[symbol].append(tick_idx, exit_price, trade_id)
+                
+                # Update stats
+                logger.debug("[_process_symbol_tick] %s: Building UI labels - Price: $%.2f, P/L: $%.2f", symbol, price, pnl)
+                
+                # Unchanged values are left out; Tk keeps showing the last text sent
+                if price != state.shown_price:
+                    state.shown_price = price
+                    labels['price'] = (f"Price: ${price:.2f}", None)
+                if pnl != state.shown_pnl:
+                    state.shown_pnl = pnl
+                    labels['pnl'] = (f"P/L: ${pnl:+.2f}", None)
+                if total_trades != state.shown_trades:
+                    state.shown_trades = total_trades
+                    labels['trades'] = (f"Trades: {total_trades}", None)
                 
                 # Update open/close prices (same pattern as range - read directly from strategy)
-                if symbol in strategy.current_positions:
-                    trade = strategy.current_positions[symbol]
-                    entry_price = trade.entry_price
-                    self.open_prices[symbol] = entry_price
-                    self.stat_labels[symbol]['open'].config(
-                        text=f"Open: ${entry_price:.2f}",
-                        foreground="green"
-                    )
-                    print(f"[_process_symbol_tick] {symbol}: Open position at ${entry_price:.2f}")
+                if position is not None:
+                    entry_price = position.entry_price
+                    state.open_price = entry_price
+                    labels['open'] = (f"Open: ${entry_price:.2f}", "green")
+                    logger.debug("[_process_symbol_tick] %s: Open position at $%.2f", symbol, entry_price)
                 else:
                     # Position closed - keep showing last trade's entry price during BUILDING phase
                     # Only clear if we have no cached value (truly no recent trades)
-                    if self.open_prices[symbol] is not None:
+                    cached_open = state.open_price
+                    if cached_open is not None:
                         # Keep showing cached entry price - it persists until next trade opens
-                        print(f"[_process_symbol_tick] {symbol}: Position closed, keeping cached Open: ${self.open_prices[symbol]:.2f}")
+                        labels['open'] = (f"Open: ${cached_open:.2f}", "green")
+                        logger.debug("[_process_symbol_tick] %s: Position closed, keeping cached Open: $%.2f", symbol, cached_open)
                     else:
                         # No cached value - show empty
-                        self.stat_labels[symbol]['open'].config(text="Open: --")
+                        labels['open'] = ("Open: --", None)
                 
                 # Update close price if available (cached from last closed trade)
-                if self.close_prices[symbol] is not None:
-                    self.stat_labels[symbol]['close'].config(
-                        text=f"Close: ${self.close_prices[symbol]:.2f}",
-                        foreground="red"
-                    )
-                    print(f"[_process_symbol_tick] {symbol}: Showing cached Close: ${self.close_prices[symbol]:.2f}")
+                cached_close = state.close_price
+                if cached_close is not None:
+                    labels['close'] = (f"Close: ${cached_close:.2f}", "red")
+                    logger.debug("[_process_symbol_tick] %s: Showing cached Close: $%.2f", symbol, cached_close)
                 else:
-                    self.stat_labels[symbol]['close'].config(text="Close: --")
-            
-            # Update chart
-            print(f"[_process_symbol_tick] {symbol}: Updating chart (prices count: {len(self.prices[symbol])})")
-            self.update_chart(symbol)
-        
-        except Exception as e:
-            print(f"[_process_symbol_tick] {symbol}: ERROR - {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def log_event(self, symbol, trade):
-        """Log trade event to event log"""
-        try:
-            trade_str = (f"[{datetime.now().strftime('%H:%M:%S')}] {symbol} {trade.direction} @ "
-                        f"${trade.entry_price:.2f} → ${trade.exit_price:.2f} | "
-                        f"P/L: ${trade.pnl:+.3f} ({trade.pnl_pct*100:+.2f}%)\n")
-            
-            self.events_text.insert(tk.END, trade_str)
+                    labels['close'] = ("Close: --", None)
             
-            # Color code
-            if trade.pnl > 0:
-                line_num = int(self.events_text.index(tk.END).split('.')[0]) - 1
-                self.events_text.tag_add("profit", f"{line_num}.0", f"{line_num}.end")
-                self.events_text.tag_config("profit", foreground="#00D084")
-            elif trade.pnl < 0:
-                line_num = int(self.events_text.index(tk.END).split('.')[0]) - 1
-                self.events_text.tag_add("loss", f"{line_num}.0", f"{line_num}.end")
-                self.events_text.tag_config("loss", foreground="#FF6B6B")
+            if order is not None:
+                method, kwargs = order
+                if self._submit_order(method, **kwargs):
+                    if method == "execute_open_trade":
+                        logger.info("[_process_symbol_tick] %s: Trading212 BUY order queued", symbol)
+                    else:
+                        logger.info("[_process_symbol_tick] %s: Trading212 SELL order queued (%s)", symbol, kwargs["exit_reason"])
             
-            self.events_text.see(tk.END)
+            # Update range information (strategy-owned, read without the lock; one .get per field)
+            if opening_range is not None:
+                if debug:
+                    logger.debug("[_process_symbol_tick] %s: strategy.opening_range exists, keys=%s", symbol, list(opening_range))
+                or_data = opening_range.get(symbol)
+                if or_data is not None:
+                    or_get = or_data.get
+                    phase = or_get("phase", "N/A")
+                    range_low = or_get("low", 0)
+                    range_high = or_get("high", 0)
+                    
+                    if phase == "BUILDING":
+                        ticks = or_get("ticks", 0)
+                        total_ticks = strategy.opening_range_ticks
+                        build_pct = (ticks / total_ticks * 100) if total_ticks > 0 else 0
+                        
+                        if debug:
+                            logger.debug("[_process_symbol_tick] 🏗️  %s BUILDING: %s/%s ticks (%.0f%%) | Range: $%.4f-$%.4f", symbol, ticks, total_ticks, build_pct, range_low, range_high)
+                            logger.debug("[_process_symbol_tick] %s DEBUG: or_data keys = %s, initialized=%s", symbol, list(or_data), or_get('initialized'))
+                        
+                        labels['range_status'] = (f"Building ({ticks}/{total_ticks})", "orange")
+                        labels['range_level'] = (f"${range_low:.4f} - ${range_high:.4f} ({build_pct:.0f}%)", None)
+                    
+                    elif phase == "LOCKED":
+                        position_locked = or_get("position_locked", False)
+                        time_left = max(0, or_get("validity_expires_at", 0) - time.time())
+                        
+                        logger.debug("[_process_symbol_tick] 🔒 %s LOCKED: $%.4f-$%.4f | position_locked=%s, time_left=%.0fs", symbol, range_low, range_high, position_locked, time_left)
+                        
+                        if position_locked:
+                            status_text = "LOCKED (Position Open)"
+                            color = "purple"
+                        else:
+                            mins_left = time_left / 60
+                            status_text = f"LOCKED ({mins_left:.1f}m)"
+                            color = "green" if time_left > 300 else "orange" if time_left > 60 else "red"
+                        
+                        labels['range_status'] = (status_text, color)
+                        labels['range_level'] = (f"${range_low:.4f} - ${range_high:.4f}", None)
+                    else:
+                        logger.debug("[_process_symbol_tick] ❌ %s Phase N/A or unknown: %s", symbol, phase)
+                        labels['range_status'] = ("Range: --", "gray")
+                        labels['range_level'] = ("--", None)
+                else:
+                    logger.debug("[_process_symbol_tick] %s: NOT in strategy.opening_range", symbol)
+            else:
+                logger.debug("[_process_symbol_tick] %s: strategy.opening_range attribute does NOT exist!", symbol)
             
-            # Keep only last 20 events
-            line_count = int(self.events_text.index('end-1c').split('.')[0])
-            if line_count > 20:
-                self.events_text.delete('1.0', '2.0')
+            return labels
         
         except Exception as e:
-            print(f"Error logging event: {e}")
+            logger.exception("[_process_symbol_tick] %s: ERROR - %s", symbol, e)
+    
+    def _enqueue_tick_log(self, tick, event):
+        """Hand a tick to the log thread, dropping the oldest entry if it falls behind"""
+        entry = (tick, event, time.time())  # Stamped now, not when the log thread writes it
+        try:
+            self._log_q.put_nowait(entry)
+        except queue.Full:
+            with contextlib.suppress(queue.Empty):
+                self._log_q.get_nowait()
+            with contextlib.suppress(queue.Full):
+                self._log_q.put_nowait(entry)
+    
+    def _drain_tick_log(self):
+        """Background loop writing queued ticks to the TickLogger in batches"""
+        log_q = self._log_q
+        while True:
+            batch = [log_q.get()]
+            while len(batch) < TICK_LOG_BATCH:
+                try:
+                    batch.append(log_q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.logger.log_ticks(batch)  # One open and write per batch
+            except Exception as e:
+                logger.error("[TickLogger] Failed to log %d ticks: %s", len(batch), e)
     
     def start_websocket(self):
-        """Connect to WebSocket server and receive data"""
-        loop = asyncio.new_event_loop()
+        """Connect to WebSocket server and receive data
+        
+        The receive loop stays on asyncio (not websockets.sync) because the
+        Trading212 broker client and the command sender are coroutines that
+        share this thread's event loop.
+        """
+        # uvloop only for this thread's loop; no global policy install (uvloop.install)
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        logger.info("[WebSocket] Using %s event loop", type(loop).__module__.split('.')[0])
         self.ws_loop = loop
-        self.ws_command_queue = asyncio.Queue()
+        self.ws_command_queue = asyncio.Queue(maxsize=WS_COMMAND_QUEUE_SIZE)
+        self._order_queue = asyncio.Queue(maxsize=ORDER_QUEUE_SIZE)
         loop.run_until_complete(self.websocket_loop())
     
     async def websocket_loop(self):
@@ -788,89 +1128,139 @@ class MultiSymbolDashboard:
         # Initialize Trading212 broker
         self.trading212_broker = await get_trading212_broker()
         await self.trading212_broker.init_client()
+        self._order_task = asyncio.create_task(self._order_worker())  # Keep a ref so it is not GC-ed
         
+        attempt = 0  # Consecutive failed/closed connections, drives the backoff
+        last_error = None  # Type of the last logged connection error (traceback once per change)
         while True:
             try:
                 uri = WEBSOCKET_CONFIG["uri"]
-                async with websockets.connect(uri) as websocket:
+                # Small JSON frames: skip permessage-deflate, read in larger chunks
+                async with websockets.connect(uri, compression=None, max_size=2**20,
+                                              read_limit=2**20, max_queue=WS_MAX_QUEUE,
+                                              ping_interval=WS_PING_INTERVAL,
+                                              ping_timeout=WS_PING_TIMEOUT) as websocket:
                     self.ws_connection = websocket
-                    self.connection_status = "Connected"
-                    print(f"[WebSocket] Connected to {uri}")
-                    self.root.after(0, lambda: self.status_label.config(
-                        text=f"Status: Connected | Waiting for data..."))
+                    sock = websocket.transport.get_extra_info('socket')
+                    if sock is not None:
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, WS_RECV_BUFFER)
+                    self.connection_status = STATUS_CONNECTED
+                    logger.info("[WebSocket] Connected to %s", uri)
+                    attempt = 0
+                    last_error = None
 
                     # Start command sender task
                     sender_task = asyncio.create_task(self.send_commands(websocket))
-                    
-                    async for message in websocket:
-                        try:
-                            data = json.loads(message)
-                            msg_keys = list(data.keys())
-                            print(f"[WebSocket] Received message with keys: {msg_keys}")
-                            
-                            # Handle symbol data (regular snapshots)
-                            if "symbols" in data:
-                                print(f"[WebSocket] Calling update_ui with {len(data['symbols'])} symbols")
-                                self.root.after(0, lambda d=data: self.update_ui(d))
-                            
-                            # Handle trade events (OPEN/CLOSE)
-                            elif data.get("type") == "TRADE_EVENT":
-                                symbol = data.get("symbol")
-                                action = data.get("action")  # "OPEN" or "CLOSE"
-                                reason = data.get("reason")
-                                price = data.get("price")
-                                print(f"[WebSocket] ✅ Trade event received: {symbol} {action} @ ${price} ({reason})")
-                                print(f"[WebSocket] Full event: {data}")
-                                self.root.after(0, lambda d=data: self.handle_trade_event(d))
-                            
-                            else:
-                                print(f"[WebSocket] ⚠️ Message doesn't match patterns. Keys: {msg_keys}")
-                                if data.get("action"):
-                                    print(f"[WebSocket] Message has 'action' field: {data.get('action')} - might be a trade event missing type!")
-                        
-                        except json.JSONDecodeError as e:
-                            print(f"[WebSocket] JSON decode error: {e}")
-                        except Exception as e:
-                            print(f"[WebSocket] Error processing message: {e}")
-                            import traceback
-                            traceback.print_exc()
-                    sender_task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await sender_task
+                    try:
+                        await self._receive_messages(websocket)
+                    finally:
+                        # Also on ConnectionClosed, so a stale sender never eats commands
+                        sender_task.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await sender_task
+                
+                # Server closed the connection cleanly
+                self.connection_status = STATUS_RETRYING
+                delay = _reconnect_delay(attempt)
+                logger.info("[WebSocket] Connection closed - reconnecting in %.1fs...", delay)
+            
+            except websockets.exceptions.ConnectionClosed as e:
+                self.connection_status = STATUS_RETRYING
+                delay = _reconnect_delay(attempt)
+                logger.warning("[WebSocket] Connection lost (%s) - reconnecting in %.1fs...", e, delay)
             
             except ConnectionRefusedError:
-                self.connection_status = "Disconnected"
-                print(f"[WebSocket] Connection refused - retrying in {WEBSOCKET_CONFIG['reconnect_delay']}s...")
-                self.root.after(0, lambda: self.status_label.config(
-                    text=f"Status: Disconnected (retrying...)"))
-                await asyncio.sleep(WEBSOCKET_CONFIG["reconnect_delay"])
+                self.connection_status = STATUS_RETRYING
+                delay = _reconnect_delay(attempt)
+                logger.warning("[WebSocket] Connection refused - retrying in %.1fs...", delay)
             
             except Exception as e:
-                self.connection_status = "Error"
-                print(f"[WebSocket] Connection error: {e}")
-                import traceback
-                traceback.print_exc()
-                await asyncio.sleep(WEBSOCKET_CONFIG["reconnect_delay"])
+                self.connection_status = STATUS_ERROR
+                delay = _reconnect_delay(attempt)
+                if type(e) is not last_error:
+                    logger.exception("[WebSocket] Connection error: %s", e)
+                    last_error = type(e)
+                else:
+                    logger.warning("[WebSocket] Connection error (again): %s - retrying in %.1fs...", e, delay)
+            
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _receive_messages(self, websocket):
+        """Dispatch incoming frames until the connection closes"""
+        received = 0
+        async for message in websocket:
+            # recv() returns buffered frames without suspending; yield now and then so
+            # send_commands and the order worker are not starved during a burst
+            received += 1
+            if received % WS_YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+            try:
+                data = json_loads(message)
+                # One dict lookup per frame; snapshots are the only messages without a "type"
+                handler = self._message_handlers.get(data.get("type"), self._on_unknown_message)
+                handler(data)
+            
+            except json.JSONDecodeError as e:
+                logger.error("[WebSocket] JSON decode error: %s", e)
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                # Valid JSON of an unexpected shape (e.g. a list or a non-dict payload)
+                logger.warning("[WebSocket] Malformed message skipped: %r", e)
+
+    def _on_snapshot_message(self, data):
+        """Untyped frame: a symbols snapshot (WS thread)"""
+        symbols = data.get("symbols")
+        if symbols is None:
+            self._on_unknown_message(data)
+            return
+        logger.debug("[WebSocket] Snapshot with %s symbols", len(symbols))
+        self._ingest_snapshot(data)
+    
+    def _on_trade_event_message(self, data):
+        """TRADE_EVENT frame: queue it for handle_trade_event on the Tk thread"""
+        symbol = data.get("symbol")
+        if symbol not in self.symbol_state:
+            return  # Multiplexed feed: not one of our slots, skip the Tk round-trip
+        logger.info("[WebSocket] ✅ Trade event received: %s %s @ $%s (%s)",
+                    symbol, data.get("action"), data.get("price"), data.get("reason"))
+        logger.debug("[WebSocket] Full event: %s", data)
+        self._trade_events.append(data)  # Tk applies it on the next _drain_ui_queue
+    
+    def _on_command_ack(self, data):
+        """Server reply to a control command (replace_ack, pause_ack, ...)"""
+        logger.info("[WebSocket] %s: %s", data.get("type"), data)
+    
+    def _on_unknown_message(self, data):
+        logger.warning("[WebSocket] ⚠️ Message doesn't match patterns. Keys: %s", list(data.keys()))
+        if data.get("action"):
+            logger.warning("[WebSocket] Message has 'action' field: %s - might be a trade event missing type!", data.get('action'))
 
     def handle_trade_event(self, event):
         """Handle OPEN/CLOSE trade events from the bot"""
         try:
+            # Reject events for symbols this dashboard is not showing before any other work
             symbol = event.get("symbol")
+            if not symbol or symbol not in self.symbol_state:
+                logger.debug("[handle_trade_event] Ignoring event for unwatched symbol: %s", symbol)
+                return
+            
             action = event.get("action")  # "OPEN" or "CLOSE"
             reason = event.get("reason", "N/A")
             price = event.get("price", 0)
             trade_data = event.get("trade", {})
             
-            if not symbol or symbol not in self.prices:
-                print(f"[handle_trade_event] Unknown symbol: {symbol}")
-                return
+            logger.debug("[handle_trade_event] %s: %s @ $%.2f (%s)", symbol, action, price, reason)
+            logger.debug("[handle_trade_event] Trade data: %s", trade_data)
+            logger.debug("[handle_trade_event] Event keys: %s", event.keys())
             
-            print(f"[handle_trade_event] {symbol}: {action} @ ${price:.2f} ({reason})")
-            print(f"[handle_trade_event] Trade data: {trade_data}")
-            print(f"[handle_trade_event] Event keys: {list(event.keys())}")
-            
-            # Get current tick count
-            current_tick_idx = len(self.prices[symbol]) - 1
+            # Absolute index of the latest tick (update_chart translates to window x).
+            # SymbolState is written by the WS thread (_ingest_snapshot): every read and
+            # write of it here holds _data_lock.
+            state = self.symbol_state[symbol]
+            with self._data_lock:
+                current_tick_idx = state.tick_count - 1
+                trade_id = state.trade_counter
+            stats = self.stat_labels.get(symbol)
             
             if action == "OPEN":
                 # Log the open trade signal
@@ -881,81 +1271,49 @@ class MultiSymbolDashboard:
                 if entry_price is None:
                     entry_price = price
                 
-                print(f"  → Opening {direction} position at ${entry_price:.2f}")
-                print(f"  → Direction: {direction}, Entry Price: {entry_price}, Type: {type(entry_price)}")
+                logger.debug("  → Opening %s position at $%.2f", direction, entry_price)
+                logger.debug("  → Direction: %s, Entry Price: %s, Type: %s", direction, entry_price, type(entry_price))
                 
                 # Track open price for this symbol
-                self.open_prices[symbol] = entry_price
-                self.close_prices[symbol] = None  # Clear previous close price
+                with self._data_lock:
+                    state.open_price = entry_price
+                    state.close_price = None  # Clear previous close price
                 
                 # Debug: Check if symbol is in stat_labels
-                if symbol not in self.stat_labels:
-                    print(f"  ❌ ERROR: {symbol} not in stat_labels!")
-                    print(f"     Available symbols: {list(self.stat_labels.keys())}")
+                if stats is None:
+                    logger.error("  ❌ ERROR: %s not in stat_labels!", symbol)
+                    logger.debug("     Available symbols: %s", list(self.stat_labels.keys()))
                     return
                 
                 # Debug: Check if 'open' key exists
-                if 'open' not in self.stat_labels[symbol]:
-                    print(f"  ❌ ERROR: 'open' key not in stat_labels[{symbol}]!")
-                    print(f"     Available keys: {list(self.stat_labels[symbol].keys())}")
+                if 'open' not in stats:
+                    logger.error("  ❌ ERROR: 'open' key not in stat_labels[%s]!", symbol)
+                    logger.debug("     Available keys: %s", list(stats.keys()))
                     return
                 
-                # Update UI label with thread-safe call - pass entry_price directly to avoid closure issues
-                def update_open_label(ep=entry_price, sym=symbol):
-                    try:
-                        label_text = f"Open: ${ep:.2f}"
-                        print(f"  [update_open_label] Setting text to: {label_text} for {sym}")
-                        self.stat_labels[sym]['open'].config(text=label_text, foreground="green")
-                        # Cache the entry price for persistence during BUILDING phase
-                        self.open_prices[sym] = ep
-                        print(f"  ✅ Updated Open label for {sym} to: {label_text} (cached)")
-                    except Exception as e:
-                        print(f"  ❌ Error updating Open label for {sym}: {e}")
-                        import traceback
-                        traceback.print_exc()
-                
-                self.root.after(0, update_open_label)
-                
-                # Add to appropriate signals list (buy/sell based on direction)
-                if direction == "LONG":
-                    self.buy_signals[symbol].append((current_tick_idx, price, self.trade_counters[symbol]))
-                    print(f"  → Added to buy signals at tick {current_tick_idx}")
-                elif direction == "SHORT":
-                    self.sell_signals[symbol].append((current_tick_idx, price, self.trade_counters[symbol]))
-                    print(f"  → Added to sell signals at tick {current_tick_idx}")
+                # Already on the Tk thread (_drain_ui_queue): write the label directly
+                self._set_label(stats['open'], f"Open: ${entry_price:.2f}", "green")
+                logger.debug("  ✅ Updated Open label for %s to: $%.2f", symbol, entry_price)
             
             elif action == "CLOSE":
                 # Log the close trade signal
-                print(f"[handle_trade_event] CLOSE action detected for {symbol}")
+                logger.debug("[handle_trade_event] CLOSE action detected for %s", symbol)
                 entry_price = trade_data.get("entry_price", 0)
                 pnl = trade_data.get("pnl", 0)
-                print(f"[handle_trade_event] Entry: ${entry_price:.2f}, Exit: ${price:.2f}, PnL: {pnl:+.2f}%")
+                logger.debug("[handle_trade_event] Entry: $%.2f, Exit: $%.2f, PnL: %+.2f%%", entry_price, price, pnl)
                 
                 # Track close price for this symbol
-                self.close_prices[symbol] = price
-                print(f"[handle_trade_event] Set close_prices[{symbol}] = ${price:.2f}")
-                # DO NOT clear open_prices - keep it cached to show during BUILDING phase
-                
-                # Update UI labels with thread-safe calls - pass values directly to avoid closure issues
-                def update_close_labels(exit_p=price, sym=symbol, ep=entry_price):
-                    try:
-                        print(f"[update_close_labels] START: Updating {sym} Close label")
-                        self.stat_labels[sym]['close'].config(text=f"Close: ${exit_p:.2f}", foreground="red")
-                        print(f"[update_close_labels] Close label updated to: Close: ${exit_p:.2f}")
-                        # Keep showing the open price (cached) - don't clear it
-                        self.stat_labels[sym]['open'].config(text=f"Open: ${ep:.2f}", foreground="green")
-                        print(f"[update_close_labels] Open label updated to: Open: ${ep:.2f}")
-                        print(f"  ✅ Updated Close label for {sym} to: ${exit_p:.2f}, Open cached: ${ep:.2f}")
-                    except Exception as e:
-                        print(f"[update_close_labels] ERROR: {e}")
-                        import traceback
-                        traceback.print_exc()
-                
-                print(f"[handle_trade_event] Scheduling update_close_labels via root.after(0)")
-                self.root.after(0, update_close_labels)
-                print(f"[handle_trade_event] Scheduled. Continuing to track close signals...")
+                with self._data_lock:
+                    state.close_price = price
+                logger.debug("[handle_trade_event] Set %s close_price = $%.2f", symbol, price)
+                # DO NOT clear open_price - keep it cached to show during BUILDING phase
                 
-                self.root.after(0, update_close_labels)
+                # Already on the Tk thread (_drain_ui_queue): write the labels directly.
+                # Keep showing the open price (cached) - don't clear it
+                if stats is not None:
+                    self._set_label(stats['close'], f"Close: ${price:.2f}", "red")
+                    self._set_label(stats['open'], f"Open: ${entry_price:.2f}", "green")
+                    logger.debug("  ✅ Updated Close label for %s to: $%.2f, Open cached: $%.2f", symbol, price, entry_price)
                 
                 # Track trades and P/L
                 self.total_trades += 1
@@ -964,52 +1322,117 @@ class MultiSymbolDashboard:
                 # Determine if this was a long or short close based on reason
                 direction = trade_data.get("direction", "UNKNOWN")
                 
-                # Add to appropriate close signals list
-                if direction == "LONG":
-                    self.buy_close_signals[symbol].append((current_tick_idx, price, 0))
-                    print(f"  → Added to buy close signals at tick {current_tick_idx}")
-                elif direction == "SHORT":
-                    self.sell_close_signals[symbol].append((current_tick_idx, price, 0))
-                    print(f"  → Added to sell close signals at tick {current_tick_idx}")
-                
-                # Update global stats (thread-safe via root.after)
+                # Update global stats
                 pnl_color = "green" if self.total_pnl >= 0 else "red"
-                
-                def update_global_stats():
-                    try:
-                        self.global_pnl_label.config(text=f"Total P/L: ${self.total_pnl:+.2f}", foreground=pnl_color)
-                        self.global_trades_label.config(text=f"Trades: {self.total_trades}")
-                        print(f"  ✅ Updated global stats: Trades={self.total_trades}, P/L=${self.total_pnl:+.2f}")
-                    except Exception as e:
-                        print(f"  ❌ Error updating global stats: {e}")
-                
-                self.root.after(0, update_global_stats)
+                self._set_label(self.global_pnl_label, f"Total P/L: ${self.total_pnl:+.2f}", pnl_color)
+                self._set_label(self.global_trades_label, f"Trades: {self.total_trades}")
+                logger.debug("  ✅ Updated global stats: Trades=%s, P/L=$%+.2f", self.total_trades, self.total_pnl)
             
-            # Force chart update to show the new signals
-            print(f"[handle_trade_event] Updating chart for {symbol}")
-            self.update_chart(symbol)
+            else:
+                return
+            
+            # Marker store by (action, direction); unknown directions get no marker.
+            # OPEN and CLOSE carry the same trade id, as on the strategy path.
+            store = self._signal_routes.get((action, direction))
+            if store is not None:
+                with self._data_lock:
+                    store[symbol].append(current_tick_idx, price, trade_id)
+                logger.debug("  → Added %s %s marker at tick %s", action, direction, current_tick_idx)
+            
+            # Queue a chart update to show the new signals
+            logger.debug("[handle_trade_event] Marking chart dirty for %s", symbol)
+            self._schedule_redraw(symbol)
         
         except Exception as e:
-            print(f"[handle_trade_event] Error processing trade event: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[handle_trade_event] Error processing trade event: %s", e)
 
-    async def send_commands(self, websocket):
-        """Send queued control commands to the server"""
+    def _submit_order(self, method, **kwargs):
+        """Queue a broker call for the order worker (WS thread only)
+
+        False when no broker is live, or when the worker is ORDER_QUEUE_SIZE orders behind
+        (the order is refused rather than queued without bound or swapped for another).
+        """
+        broker = self.trading212_broker
+        if broker is None or not broker.enabled or self._order_queue is None:
+            return False
+        try:
+            self._order_queue.put_nowait((method, kwargs))
+        except asyncio.QueueFull:
+            logger.error("[Trading212] Order queue full (%s pending); %s for %s not sent",
+                         ORDER_QUEUE_SIZE, method, kwargs.get("symbol"))
+            return False
+        return True
+
+    async def _order_worker(self):
+        """Submit queued broker orders: symbols run concurrently, each symbol's orders in sequence"""
+        order_queue = self._order_queue
         while True:
-            cmd = await self.ws_command_queue.get()
+            by_symbol = {}
+            method, kwargs = await order_queue.get()
+            while True:
+                by_symbol.setdefault(kwargs.get("symbol"), []).append((method, kwargs))
+                if order_queue.empty():
+                    break
+                method, kwargs = order_queue.get_nowait()
+            await asyncio.gather(*(self._run_orders(orders) for orders in by_symbol.values()))
+    
+    async def _run_orders(self, orders):
+        """Await one symbol's broker calls in submission order"""
+        for method, kwargs in orders:
             try:
-                await websocket.send(json.dumps(cmd))
-                print(f"[WebSocket] Sent command: {cmd}")
+                await getattr(self.trading212_broker, method)(**kwargs)
             except Exception as e:
-                print(f"[WebSocket] Failed to send command {cmd}: {e}")
+                logger.exception("[Trading212] %s failed for %s: %s", method, kwargs.get("symbol"), e)
+
+    @staticmethod
+    def _coalesce_commands(batch):
+        """Collapse a burst of commands: only the last pause/resume and the last status query survive"""
+        last = {}
+        for i, cmd in enumerate(batch):
+            kind = _SUPERSEDED_COMMANDS.get(cmd.get("command"))
+            if kind is not None:
+                last[kind] = i
+        return [cmd for i, cmd in enumerate(batch)
+                if _SUPERSEDED_COMMANDS.get(cmd.get("command")) is None
+                or last[_SUPERSEDED_COMMANDS[cmd.get("command")]] == i]
+    
+    async def send_commands(self, websocket):
+        """Send queued control commands to the server, draining bursts in one pass"""
+        command_queue = self.ws_command_queue
+        while True:
+            batch = [await command_queue.get()]
+            while not command_queue.empty():
+                batch.append(command_queue.get_nowait())
+            sent_kept = sum(_SUPERSEDED_COMMANDS.get(cmd.get("command")) is None for cmd in batch)
+            if sent_kept:
+                with self._command_lock:
+                    self._unsent_kept_commands -= sent_kept
+            # The server takes one JSON command per frame, so bursts are coalesced, not merged
+            for cmd in self._coalesce_commands(batch) if len(batch) > 1 else batch:
+                try:
+                    await websocket.send(json_dumps(cmd))
+                    logger.debug("[WebSocket] Sent command: %s", cmd)
+                except Exception as e:
+                    logger.error("[WebSocket] Failed to send command %s: %s", cmd, e)
 
 
 def main():
     """Entry point"""
-    root = tk.Tk()
-    app = MultiSymbolDashboard(root, symbols=SYMBOLS)
-    root.mainloop()
+    # The Tk and WS threads only enqueue records; console I/O happens on the listener thread
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))  # Layout is applied by `handler`
+    logging.basicConfig(level=LOG_CONFIG["dashboard_level"], handlers=[queue_handler])
+    listener.start()
+    try:
+        root = tk.Tk()
+        app = MultiSymbolDashboard(root, symbols=SYMBOLS)
+        root.mainloop()
+    finally:
+        listener.stop()  # Flushes records still queued
 
 
 if __name__ == "__main__":
@@ -6,37 +6,59 @@ from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from collections import deque
-from datetime import datetime
 import threading
 import time
+import numpy as np
+
+try:
+    import uvloop
+except ImportError:  # Optional (not available on Windows) - fall back to the stock asyncio loop
+    uvloop = None
+
+try:
+    import orjson
+    json_loads = orjson.loads  # Raises a json.JSONDecodeError subclass
+except ImportError:  # Optional C parser - fall back to the stdlib
+    json_loads = json.loads
 
 from bot.models import Tick
 from bot.strategy import MicroTradingStrategy
 from bot.tick_logger import TickLogger
 from bot.config import WEBSOCKET_CONFIG, SYMBOL
+from websocket_ui.chart_buffers import RingBuffer, SignalBuffer, SlidingMinMax
 
 # Configuration
 MAX_DATA_POINTS = 100
+REDRAW_INTERVAL_MS = 33  # Chart refresh cadence (~30 FPS); ticks in between only mark it dirty
+DRAIN_INTERVAL_MS = 16  # How often Tk applies the ticks queued by the WebSocket thread
+INBOX_SIZE = 1000  # Render records held for Tk; past this, price-only records are coalesced (trades never are)
+EVENT_LOG_LINES = 50  # Tick events kept in the events log
+TICK_LOG_FLUSH_S = 0.5  # How often queued ticks are written to the tick log in one batch
+TICK_LOG_QUEUE_SIZE = 10_000  # Pending tick log entries before the oldest are dropped
+TICK_LOG_SHUTDOWN_S = 2.0  # How long closing the window waits for the last tick log batch
+TRADE_HISTORY_SIZE = 500  # Closed trades kept in memory (the strategy keeps the full record)
+SIGNAL_LABELS_MAX = 32  # Trade id labels per signal kind (most recent first); older markers go unlabelled
+
+# Trade signal scatter styles by kind, in legend order (artists are built once)
+_SIGNAL_STYLES = {
+    'buy_open': dict(marker='^', color='#00D084', s=300, label="BUY OPEN", zorder=5,
+                     edgecolors='darkgreen', linewidths=2),
+    'sell_open': dict(marker='v', color='#FF6B6B', s=300, label="SELL OPEN", zorder=5,
+                      edgecolors='darkred', linewidths=2),
+    'buy_close': dict(marker='X', color='#00AA55', s=250, label="BUY CLOSE", zorder=4,
+                      edgecolors='darkgreen', linewidths=1, alpha=0.7),
+    'sell_close': dict(marker='X', color='#CC4444', s=250, label="SELL CLOSE", zorder=4,
+                       edgecolors='darkred', linewidths=1, alpha=0.7),
+}
 
+# Trade id label per signal kind: (prefix, y offset from the marker, show cost, text style)
+_SIGNAL_LABELS = {
+    'buy_open': ('B', 0.3, True, dict(fontsize=8, color='darkgreen')),
+    'sell_open': ('S', -0.5, True, dict(fontsize=8, color='darkred')),
+    'buy_close': ('B', 0.5, False, dict(fontsize=7, color='darkgreen', alpha=0.8)),
+    'sell_close': ('S', -0.5, False, dict(fontsize=7, color='darkred', alpha=0.8)),
+}
 
-def _shift_and_prune_signals(signal_deque, shift=-1, has_cost=False):
-    """Shift signal x-coordinates and drop any that fall off the chart window"""
-    if shift == 0:
-        return
-    updated = deque()
-    for item in signal_deque:
-        if has_cost:
-            x, p, tid, cost = item
-            nx = x + shift
-            if nx >= 0:
-                updated.append((nx, p, tid, cost))
-        else:
-            x, p, tid = item
-            nx = x + shift
-            if nx >= 0:
-                updated.append((nx, p, tid))
-    signal_deque.clear()
-    signal_deque.extend(updated)
 
 class TradingDashboardBot:
     def __init__(self, root):
@@ -46,25 +68,49 @@ class TradingDashboardBot:
         self.root.geometry("1400x900")
         
         # Data storage
-        self.prices = deque(maxlen=MAX_DATA_POINTS)
+        self.prices = RingBuffer(MAX_DATA_POINTS)
+        self.price_extrema = SlidingMinMax(MAX_DATA_POINTS)  # O(1) y-limits over the same window
         self.bid_prices = deque(maxlen=MAX_DATA_POINTS)
         self.ask_prices = deque(maxlen=MAX_DATA_POINTS)
         self.timestamps = deque(maxlen=MAX_DATA_POINTS)
-        self.buy_signals = deque()  # Buy entry points: (x, price, trade_id, cost)
-        self.sell_signals = deque()  # Sell entry points: (x, price, trade_id, cost)
-        self.buy_close_signals = deque()  # Buy close points: (x, price, trade_id)
-        self.sell_close_signals = deque()  # Sell close points: (x, price, trade_id)
-        self.trades_history = []
+        # Signals are keyed by absolute tick index (tick_count - 1 when recorded);
+        # chart x = tick - window origin, so sliding the window never rewrites them
+        self.buy_signals = SignalBuffer(MAX_DATA_POINTS)  # Buy entry points (with cost)
+        self.sell_signals = SignalBuffer(MAX_DATA_POINTS)  # Sell entry points (with cost)
+        self.buy_close_signals = SignalBuffer(MAX_DATA_POINTS)  # Buy close points
+        self.sell_close_signals = SignalBuffer(MAX_DATA_POINTS)  # Sell close points
+        self._signals_by_kind = {'buy_open': self.buy_signals, 'sell_open': self.sell_signals,
+                                 'buy_close': self.buy_close_signals, 'sell_close': self.sell_close_signals}
+        self.trades_history = deque(maxlen=TRADE_HISTORY_SIZE)
         self.trade_counter = 0  # Unique trade ID
         
         self.strategy = MicroTradingStrategy()
         self.tick_count = 0
+        self._chart_dirty = False  # Set by ticks, cleared by the next _redraw_tick
+        self._inbox = deque()  # Render records from the WebSocket thread, drained on Tk
+        self._inbox_lock = threading.Lock()  # Guards _inbox and _inbox_coalesced across the two threads
+        self._inbox_coalesced = 0  # Price-only records replaced by a newer one since the last drain
+        # Text log lines not yet written to their widgets; flushed once per frame by _redraw_tick
+        self._event_lines = deque(maxlen=EVENT_LOG_LINES)
+        self._event_line_count = 0  # Lines currently in events_text (saves an index() round-trip)
+        self._trade_lines = deque()  # (line, tag) pairs for trades_text
+        self._stat_vars = {}  # {stat label attr: StringVar} bound to the stats labels
+        self._pending_stats = {}  # {stat label attr: text} for the next _redraw_tick
+        self._stat_text = {}  # {stat label attr: text} last set, so unchanged stats skip Tcl
+        self._clock_second = None  # Wall-clock second _clock_text was formatted for
+        self._clock_text = ""  # "HH:MM:SS" stamp shared by every tick within that second
         self.connection_status = "Disconnected"
         self.logger = TickLogger()
+        self._tick_log = deque(maxlen=TICK_LOG_QUEUE_SIZE)  # (tick, event, time) awaiting _flush_tick_log
+        self.ws_loop = None
+        self._tick_log_stop = None  # asyncio.Event on ws_loop, set by on_close
+        self._flush_task = None  # _flush_tick_log on ws_loop; kept so it is not GC-ed
         
         # Setup UI
         self.setup_ui()
         
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Start WebSocket connection in background thread
         self.ws_thread = threading.Thread(target=self.start_websocket, daemon=True)
         self.ws_thread.start()
@@ -114,8 +160,10 @@ class TradingDashboardBot:
             label = ttk.Label(frame, text=label_text + ":", font=("Arial", 9))
             label.pack(side=tk.LEFT)
             
-            value_label = ttk.Label(frame, text="--", font=("Arial", 10, "bold"))
+            value_var = tk.StringVar(master=self.root, value="--")
+            value_label = ttk.Label(frame, textvariable=value_var, font=("Arial", 10, "bold"))
             value_label.pack(side=tk.LEFT, padx=(5, 0))
+            self._stat_vars[attr_name] = value_var
             
             setattr(self, attr_name, value_label)
         
@@ -128,16 +176,53 @@ class TradingDashboardBot:
         chart_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
         # Create figure
+        # dpi stays at 100: the Tk backend applies the display's pixel ratio itself
         self.fig = Figure(figsize=(8, 5), dpi=100)
         self.ax = self.fig.add_subplot(111)
-        self.ax.set_title(f"{self.symbol} Price with Buy/Sell Signals")
-        self.ax.set_xlabel("Time (Events)")
+        self.ax.set_title(f"{self.symbol} Price with Trade Signals (Unique IDs)")
+        self.ax.set_xlabel("Time (Ticks)")
         self.ax.set_ylabel("Price ($)")
         self.ax.grid(True, alpha=0.3)
+        # Fixed margins instead of measuring text with tight_layout(), so the background can be reused
+        self.fig.subplots_adjust(left=0.11, right=0.98, top=0.92, bottom=0.12)
+        # Fixed x span: the window fills left to right, then scrolls, without rescaling x
+        self.ax.set_xlim(0, MAX_DATA_POINTS - 1)
+        self._x_axis = np.arange(MAX_DATA_POINTS)  # Shared x coordinates for the price line
+        
+        # Persistent artists; update_chart only swaps their data and blits them
+        self._price_line, = self.ax.plot([], [], label="Price", color="#2E7D32", linewidth=2,
+                                         marker='o', markersize=3, alpha=0.8)
+        self._signal_scatters = {kind: self.ax.scatter([], [], **style)
+                                 for kind, style in _SIGNAL_STYLES.items()}
+        self._legend = self.ax.legend(handles=[self._price_line, *self._signal_scatters.values()],
+                                      loc='upper left', fontsize=9)
+        # Fixed pool of trade id labels per kind, repositioned each frame instead of recreated.
+        # Clipped to the axes: labels near the y-limits must not paint outside the blitted region
+        self._signal_labels = {
+            kind: [self.ax.text(0, 0, "", ha='center', weight='bold', visible=False, clip_on=True,
+                                **style)
+                   for _ in range(SIGNAL_LABELS_MAX)]
+            for kind, (_, _, _, style) in _SIGNAL_LABELS.items()
+        }
+        # Live artists stay out of full draws and are blitted over the cached background,
+        # painted in the order a full draw would use (zorder), the legend last on top
+        self._live_artists = sorted(
+            (self._price_line, *self._signal_scatters.values(),
+             *(text for pool in self._signal_labels.values() for text in pool)),
+            key=lambda artist: artist.get_zorder())
+        self._live_artists.append(self._legend)
+        for artist in self._live_artists:
+            artist.set_animated(True)
+        self._background = None  # Static pixels from the last full draw; None forces a full draw
+        self._ylim = None  # Y-limits baked into _background
         
         # Embed matplotlib
         self.canvas = FigureCanvasTkAgg(self.fig, master=chart_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas_widget = self.canvas.get_tk_widget()
+        canvas_widget.pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self._on_chart_drawn)
+        # A resize makes the cached background the wrong size: drop it until the backend's redraw
+        canvas_widget.bind('<Configure>', self._on_chart_resized, add='+')
         
         # Right: Recent trades
         trades_frame = ttk.LabelFrame(charts_container, text="Recent Trades", padding=5)
@@ -151,6 +236,9 @@ class TradingDashboardBot:
                                    font=("Courier", 8))
         self.trades_text.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.trades_text.yview)
+        # Color by profit/loss
+        self.trades_text.tag_config("profit", foreground="#00D084")
+        self.trades_text.tag_config("loss", foreground="#FF6B6B")
         
         # Bottom: Events log
         events_frame = ttk.LabelFrame(main_frame, text="Tick Events Log", padding=5)
@@ -163,235 +251,260 @@ class TradingDashboardBot:
                                    font=("Courier", 8))
         self.events_text.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.events_text.yview)
+        
+        self.root.after(DRAIN_INTERVAL_MS, self._drain_inbox)
+        self.root.after(REDRAW_INTERVAL_MS, self._redraw_tick)
+    
+    def _queue_render(self, msg):
+        """Hand a render record to Tk (WebSocket thread).
+
+        Once INBOX_SIZE records are pending, a price-only record replaces the newest
+        pending price-only record instead of growing the inbox. OPEN/CLOSE records are
+        always queued, so the trade history and P&L never miss an event.
+        """
+        with self._inbox_lock:
+            inbox = self._inbox
+            if (len(inbox) >= INBOX_SIZE and msg["action"] not in ("OPEN", "CLOSE")
+                    and inbox[-1]["action"] not in ("OPEN", "CLOSE")):
+                inbox[-1] = msg
+                self._inbox_coalesced += 1
+            else:
+                inbox.append(msg)
+    
+    def _drain_inbox(self):
+        """Apply every tick processed since the last pass in one Tk callback"""
+        try:
+            with self._inbox_lock:
+                inbox, self._inbox = self._inbox, deque()
+                coalesced, self._inbox_coalesced = self._inbox_coalesced, 0
+            if coalesced:
+                print(f"Dashboard fell behind the feed: skipped {coalesced} price updates")
+            for msg in inbox:
+                self._apply_tick(msg)
+        finally:
+            self.root.after(DRAIN_INTERVAL_MS, self._drain_inbox)
+    
+    def _redraw_tick(self):
+        """Redraw the chart at most once per frame, however many ticks arrived since the last one"""
+        try:
+            self._flush_text_logs()
+            self._flush_stats()
+            # Minimised: nothing is on screen, so keep the chart dirty until the window is restored
+            if self._chart_dirty and self.root.state() != 'iconic':
+                self._chart_dirty = False
+                self.update_chart()
+        except Exception as e:
+            print(f"Error updating chart: {e}")
+        finally:
+            self.root.after(REDRAW_INTERVAL_MS, self._redraw_tick)
+    
+    def _flush_stats(self):
+        """Push the latest stats text into the label StringVars, skipping unchanged values"""
+        for name, text in self._pending_stats.items():
+            if self._stat_text.get(name) != text:
+                self._stat_text[name] = text
+                self._stat_vars[name].set(text)
+        self._pending_stats.clear()
+    
+    def _clock(self):
+        """Current HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._clock_second:
+            self._clock_second = now
+            self._clock_text = time.strftime('%H:%M:%S', time.localtime(now))
+        return self._clock_text
+    
+    def _flush_text_logs(self):
+        """Write queued trade and event lines with one insert per widget"""
+        if self._trade_lines:
+            chunks = []
+            for trade_str, tag in self._trade_lines:
+                chunks.append(trade_str)
+                chunks.append(tag)
+            self._trade_lines.clear()
+            self.trades_text.insert(tk.END, *chunks)
+            self.trades_text.see(tk.END)
+        
+        if self._event_lines:
+            self._event_line_count += len(self._event_lines)
+            self.events_text.insert(tk.END, "".join(self._event_lines))
+            self._event_lines.clear()
+            # Keep only the last EVENT_LOG_LINES lines
+            overflow = self._event_line_count - EVENT_LOG_LINES
+            if overflow > 0:
+                self.events_text.delete('1.0', f'{overflow + 1}.0')
+                self._event_line_count = EVENT_LOG_LINES
+            self.events_text.see(tk.END)
+    
+    def _on_chart_resized(self, event=None):
+        """Canvas resized: never blit over the old-size background; the next frame draws in full"""
+        self._background = None
+        self._chart_dirty = True
+    
+    def _on_chart_drawn(self, event=None):
+        """After a full draw (redraw, resize): cache the static background, paint the live artists"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._live_artists:
+            self.ax.draw_artist(artist)
+    
+    def _label_signals(self, kind, signals, origin):
+        """Point the label pool for one signal kind at its most recent markers, hide the rest"""
+        prefix, dy, show_cost, _ = _SIGNAL_LABELS[kind]
+        pool = self._signal_labels[kind]
+        hi = signals.hi
+        lo = max(signals.lo, hi - len(pool))
+        for text, tick, p, tid, cost in zip(pool, signals.idx[lo:hi].tolist(), signals.price[lo:hi].tolist(),
+                                            signals.trade_id[lo:hi].tolist(), signals.cost[lo:hi].tolist()):
+            text.set_position((tick - origin, p + dy))
+            text.set_text(f"{prefix}{tid}\n${cost:.0f}" if show_cost else f"{prefix}{tid}✓")
+            text.set_visible(True)
+        for text in pool[hi - lo:]:
+            text.set_visible(False)
     
     def update_chart(self):
         """Update the price chart with all trade signals - symbols stay aligned"""
-        self.ax.clear()
+        if not self.prices:
+            return
         
-        if len(self.prices) > 0:
-            x_data = list(range(len(self.prices)))
-            
-            # Plot price line
-            self.ax.plot(x_data, list(self.prices), label="Price", 
-                        color="#2E7D32", linewidth=2, marker='o', markersize=3, alpha=0.8)
-            
-            # Build a mapping of price index to trade signals for accurate alignment
-            buy_open_map = {x: (p, tid, cost) for x, p, tid, cost in self.buy_signals}
-            sell_open_map = {x: (p, tid, cost) for x, p, tid, cost in self.sell_signals}
-            buy_close_map = {x: (p, tid) for x, p, tid in self.buy_close_signals}
-            sell_close_map = {x: (p, tid) for x, p, tid in self.sell_close_signals}
-            
-            # Plot BUY OPEN signals (green upward triangle)
-            if buy_open_map:
-                buy_x = list(buy_open_map.keys())
-                buy_y = [buy_open_map[x][0] for x in buy_x]
-                self.ax.scatter(buy_x, buy_y, marker='^', color='#00D084', s=300, 
-                              label="BUY OPEN", zorder=5, edgecolors='darkgreen', linewidths=2)
-                
-                # Add trade IDs and cost to buy signals
-                for x in buy_x:
-                    p, tid, cost = buy_open_map[x]
-                    self.ax.text(x, p + 0.3, f"B{tid}\n${cost:.0f}", fontsize=8, ha='center', 
-                               color='darkgreen', weight='bold')
-            
-            # Plot SELL OPEN signals (red downward triangle)
-            if sell_open_map:
-                sell_x = list(sell_open_map.keys())
-                sell_y = [sell_open_map[x][0] for x in sell_x]
-                self.ax.scatter(sell_x, sell_y, marker='v', color='#FF6B6B', s=300, 
-                              label="SELL OPEN", zorder=5, edgecolors='darkred', linewidths=2)
-                
-                # Add trade IDs and cost to sell signals
-                for x in sell_x:
-                    p, tid, cost = sell_open_map[x]
-                    self.ax.text(x, p - 0.5, f"S{tid}\n${cost:.0f}", fontsize=8, ha='center', 
-                               color='darkred', weight='bold')
-            
-            # Plot BUY CLOSE signals (green X)
-            if buy_close_map:
-                buy_close_x = list(buy_close_map.keys())
-                buy_close_y = [buy_close_map[x][0] for x in buy_close_x]
-                self.ax.scatter(buy_close_x, buy_close_y, marker='X', color='#00AA55', s=250, 
-                              label="BUY CLOSE", zorder=4, edgecolors='darkgreen', linewidths=1, alpha=0.7)
-                
-                # Add trade IDs to buy close
-                for x in buy_close_x:
-                    p, tid = buy_close_map[x]
-                    self.ax.text(x, p + 0.5, f"B{tid}✓", fontsize=7, ha='center', 
-                               color='darkgreen', weight='bold', alpha=0.8)
-            
-            # Plot SELL CLOSE signals (red X)
-            if sell_close_map:
-                sell_close_x = list(sell_close_map.keys())
-                sell_close_y = [sell_close_map[x][0] for x in sell_close_x]
-                self.ax.scatter(sell_close_x, sell_close_y, marker='X', color='#CC4444', s=250, 
-                              label="SELL CLOSE", zorder=4, edgecolors='darkred', linewidths=1, alpha=0.7)
-                
-                # Add trade IDs to sell close
-                for x in sell_close_x:
-                    p, tid = sell_close_map[x]
-                    self.ax.text(x, p - 0.5, f"S{tid}✓", fontsize=7, ha='center', 
-                               color='darkred', weight='bold', alpha=0.8)
-            
-            self.ax.legend(loc='upper left', fontsize=9)
-            self.ax.set_title(f"{self.symbol} Price with Trade Signals (Unique IDs)")
-            self.ax.set_xlabel("Time (Ticks)")
-            self.ax.set_ylabel("Price ($)")
-            self.ax.grid(True, alpha=0.3)
-            
-            # Set y-axis limits
-            if self.prices:
-                price_min = min(self.prices)
-                price_max = max(self.prices)
-                padding = (price_max - price_min) * 0.1 if price_max != price_min else 1
-                self.ax.set_ylim(price_min - padding, price_max + padding)
-            
-            # Show the full window of retained ticks to avoid shrinking after 60+ ticks
-            if len(self.prices) > 1:
-                self.ax.set_xlim(0, len(self.prices) - 1)
-            else:
-                self.ax.set_xlim(0, 1)
+        prices = self.prices.view()
+        self._price_line.set_data(self._x_axis[:len(prices)], prices)
+        
+        # Signal x is relative to the oldest retained tick, so markers stay on their price point
+        origin = self.tick_count - len(prices)
+        for kind, signals in self._signals_by_kind.items():
+            signals.prune_before(origin)  # Once per frame rather than once per tick
+            lo, hi = signals.lo, signals.hi
+            offsets = np.empty((hi - lo, 2))
+            np.subtract(signals.idx[lo:hi], origin, out=offsets[:, 0])
+            offsets[:, 1] = signals.price[lo:hi]
+            self._signal_scatters[kind].set_offsets(offsets)
+            # Trade IDs and cost on open signals, a check mark on closes
+            self._label_signals(kind, signals, origin)
+        
+        # Y-axis limits from the window
+        price_min = self.price_extrema.min
+        price_max = self.price_extrema.max
+        padding = (price_max - price_min) * 0.1 if price_max != price_min else 1
+        ylim = (price_min - padding, price_max + padding)
+        
+        if ylim != self._ylim or self._background is None:
+            # Axes changed: schedule a full draw; _on_chart_drawn re-caches the background
+            # and paints the artists, and until then frames keep landing here
+            self.ax.set_ylim(*ylim)
+            self._ylim = ylim
+            self._background = None
+            self.canvas.draw_idle()
+            return
         
-        self.fig.tight_layout()
-        self.canvas.draw()
+        # Only the data moved: repaint the live artists over the cached background
+        self.canvas.restore_region(self._background)
+        for artist in self._live_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox.padded(1))  # Include the spine column on the bbox edge
     
-    def update_ui(self, data):
-        """Update UI with new data (expects raw snapshot)."""
-        try:
-            if "ticker" not in data:
-                return
-
-            ticker = data.get("ticker", {})
-            day = ticker.get("day", {})
-            minute = ticker.get("min", {})
+    def _process_snapshot(self, data):
+        """WebSocket thread: run one raw snapshot through the strategy and tick log
+        
+        Returns the render record _apply_tick needs on the Tk thread, or None if
+        the snapshot carries no price.
+        """
+        ticker = data.get("ticker", {})
+        day = ticker.get("day", {})
+        minute = ticker.get("min", {})
 
-            price = minute.get("c") or day.get("c")
-            if price is None:
-                return
+        price = minute.get("c") or day.get("c")
+        if price is None:
+            return None
 
-            volume = minute.get("v") or day.get("v") or 0
-            bid = round(price - 0.01, 2)
-            ask = round(price + 0.01, 2)
-            updated_ns = ticker.get("updated") or int(time.time() * 1e9)
+        volume = minute.get("v") or day.get("v") or 0
+        updated_ns = ticker.get("updated") or time.time_ns()
 
-            # Synthetic results dict for downstream processing
-            results = {
-                "P": price,
-                "p": bid,
-                "S": volume,
-                "s": volume,
-                "T": ticker.get("ticker", self.symbol),
-                "t": updated_ns,
-                "q": updated_ns,
-                "X": 11,
-                "x": 11,
-                "y": updated_ns,
-                "z": 1,
-            }
+        # Process through strategy
+        tick = Tick(price=price, volume=volume, timestamp_ns=updated_ns, symbol=self.symbol)
+        event = self.strategy.process_tick(tick)
+        
+        # Log the tick and event (written in batches by _flush_tick_log)
+        self._tick_log.append((tick, event, time.time()))
+        
+        # Unique trade IDs: opens take the next one, a close reuses the latest
+        trade = event["trade"]
+        if event["action"] == "OPEN":
+            self.trade_counter += 1
+        elif event["action"] == "CLOSE" and trade:
+            self.logger.log_trade(trade)
+        
+        position = self.strategy.current_positions.get(self.symbol)
+        return {
+            "price": price,
+            "bid": round(price - 0.01, 2),
+            "ask": round(price + 0.01, 2),
+            "action": event["action"],
+            "trade": trade,
+            "trade_id": self.trade_counter,
+            "position": position.direction if position else "None",
+            "metrics": event["metrics"],
+        }
+    
+    def _apply_tick(self, msg):
+        """Tk thread: apply one render record to the buffers, logs and labels
+        
+        Only this thread touches the chart buffers; the chart itself is redrawn
+        by _redraw_tick.
+        """
+        try:
+            price, bid, ask = msg["price"], msg["bid"], msg["ask"]
             
-            if price is not None:
-                # Update prices; when window slides, shift stored signal indices
-                window_full = len(self.prices) == self.prices.maxlen
-                self.prices.append(price)
-                self.bid_prices.append(bid)
-                self.ask_prices.append(ask)
-                self.tick_count += 1
-
-                # If we just dropped the oldest point, shift trade signal positions left
-                if window_full:
-                    _shift_and_prune_signals(self.buy_signals, shift=-1, has_cost=True)
-                    _shift_and_prune_signals(self.sell_signals, shift=-1, has_cost=True)
-                    _shift_and_prune_signals(self.buy_close_signals, shift=-1, has_cost=False)
-                    _shift_and_prune_signals(self.sell_close_signals, shift=-1, has_cost=False)
-                
-                # Process through strategy
-                tick = Tick(price=price, volume=results.get("S"), 
-                          timestamp_ns=results.get("t"), symbol=self.symbol)
-                
-                event = self.strategy.process_tick(tick)
-                
-                # Log the tick and event
-                self.logger.log_tick(tick, event)
-                
-                # Handle trade signals with unique IDs
-                if event["action"] == "OPEN":
-                    trade = event["trade"]
-                    self.trade_counter += 1
-                    if trade and trade.direction == "LONG":
-                        cost = trade.entry_price * trade.position_size
-                        self.buy_signals.append((len(self.prices)-1, price, self.trade_counter, cost))
-                    elif trade and trade.direction == "SHORT":
-                        cost = trade.entry_price * trade.position_size
-                        self.sell_signals.append((len(self.prices)-1, price, self.trade_counter, cost))
-                
-                if event["action"] == "CLOSE":
-                    trade = event["trade"]
-                    if trade:
-                        self.trades_history.append(trade)
-                        self.logger.log_trade(trade)
-                        
-                        # Track close point with same trade ID
-                        # Find the trade ID from open signals
-                        trade_id = self.trade_counter
-                        
-                        if trade.direction == "LONG":
-                            self.buy_close_signals.append((len(self.prices)-1, trade.exit_price, trade_id))
-                        elif trade.direction == "SHORT":
-                            self.sell_close_signals.append((len(self.prices)-1, trade.exit_price, trade_id))
-                        
-                        # Update trades display
-                        trade_str = (f"[{trade.exit_time.strftime('%H:%M:%S')}] "
-                                   f"{trade.direction} @ ${trade.entry_price:.2f} → "
-                                   f"${trade.exit_price:.2f} ({trade.exit_reason}) | "
-                                   f"P/L: ${trade.pnl:.3f} ({trade.pnl_pct*100:+.2f}%)\n")
-                        
-                        # Color by profit/loss
-                        self.trades_text.insert(tk.END, trade_str)
-                        if trade.pnl > 0:
-                            line_num = int(self.trades_text.index(tk.END).split('.')[0]) - 1
-                            self.trades_text.tag_add("profit", f"{line_num}.0", f"{line_num}.end")
-                            self.trades_text.tag_config("profit", foreground="#00D084")
-                        elif trade.pnl < 0:
-                            line_num = int(self.trades_text.index(tk.END).split('.')[0]) - 1
-                            self.trades_text.tag_add("loss", f"{line_num}.0", f"{line_num}.end")
-                            self.trades_text.tag_config("loss", foreground="#FF6B6B")
-                        
-                        self.trades_text.see(tk.END)
-                
-                # Update stats
-                metrics = event["metrics"]
-                self.current_price_label.config(text=f"${price:.2f}")
-                
-                position_text = "LONG" if self.strategy.current_position and self.strategy.current_position.direction == "LONG" else \
-                               "SHORT" if self.strategy.current_position and self.strategy.current_position.direction == "SHORT" else \
-                               "None"
-                self.position_label.config(text=position_text)
-                
-                self.trades_label.config(text=f"{metrics['total_trades']}")
-                self.win_rate_label.config(text=f"{metrics['win_rate']*100:.1f}%")
-                
-                daily_pnl_str = f"${metrics['daily_pnl']:.2f}"
-                daily_pnl_color = "green" if metrics['daily_pnl'] >= 0 else "red"
-                self.daily_pnl_label.config(text=daily_pnl_str)
-                
-                total_pnl_str = f"${metrics['total_pnl']:.2f}"
-                total_pnl_color = "green" if metrics['total_pnl'] >= 0 else "red"
-                self.total_pnl_label.config(text=total_pnl_str)
-                
-                self.max_drawdown_label.config(text=f"${metrics['max_drawdown']:.2f}")
-                
-                # Update events log
-                event_text = f"[{datetime.now().strftime('%H:%M:%S')}] Price: ${price:.2f} | Bid: ${bid:.2f} | Ask: ${ask:.2f}"
-                self.events_text.insert(tk.END, event_text + "\n")
-                self.events_text.see(tk.END)
+            # Update prices; signals that slid out of the window are dropped at draw time
+            self.prices.append(price)
+            self.price_extrema.append(price)
+            self.bid_prices.append(bid)
+            self.ask_prices.append(ask)
+            self.tick_count += 1
+            self._chart_dirty = True
+            tick_idx = self.tick_count - 1
+            
+            # Handle trade signals with unique IDs
+            trade = msg["trade"]
+            trade_id = msg["trade_id"]
+            if msg["action"] == "OPEN" and trade:
+                cost = trade.entry_price * trade.position_size
+                if trade.direction == "LONG":
+                    self.buy_signals.append(tick_idx, price, trade_id, cost)
+                elif trade.direction == "SHORT":
+                    self.sell_signals.append(tick_idx, price, trade_id, cost)
+            
+            if msg["action"] == "CLOSE" and trade:
+                self.trades_history.append(trade)
                 
-                # Keep only last 50 lines
-                line_count = int(self.events_text.index('end-1c').split('.')[0])
-                if line_count > 50:
-                    self.events_text.delete('1.0', '2.0')
+                # Track close point with same trade ID
+                if trade.direction == "LONG":
+                    self.buy_close_signals.append(tick_idx, trade.exit_price, trade_id)
+                elif trade.direction == "SHORT":
+                    self.sell_close_signals.append(tick_idx, trade.exit_price, trade_id)
                 
-                # Update chart
-                self.update_chart()
+                # Update trades display
+                trade_str = (f"[{trade.exit_time.strftime('%H:%M:%S')}] "
+                           f"{trade.direction} @ ${trade.entry_price:.2f} → "
+                           f"${trade.exit_price:.2f} ({trade.exit_reason}) | "
+                           f"P/L: ${trade.pnl:.3f} ({trade.pnl_pct*100:+.2f}%)\n")
+                tag = "profit" if trade.pnl > 0 else "loss" if trade.pnl < 0 else ()
+                self._trade_lines.append((trade_str, tag))
+            
+            # Update stats; only the latest tick per frame reaches the labels (_flush_stats)
+            metrics = msg["metrics"]
+            price_str = f"${price:.2f}"
+            stats = self._pending_stats
+            stats["current_price_label"] = price_str
+            stats["position_label"] = msg["position"]
+            stats["trades_label"] = f"{metrics['total_trades']}"
+            stats["win_rate_label"] = f"{metrics['win_rate']*100:.1f}%"
+            stats["daily_pnl_label"] = f"${metrics['daily_pnl']:.2f}"
+            stats["total_pnl_label"] = f"${metrics['total_pnl']:.2f}"
+            stats["max_drawdown_label"] = f"${metrics['max_drawdown']:.2f}"
+            
+            # Update events log
+            self._event_lines.append(
+                f"[{self._clock()}] Price: {price_str} | Bid: ${bid:.2f} | Ask: ${ask:.2f}\n")
         
         except Exception as e:
             print(f"Error updating UI: {e}")
@@ -400,16 +513,56 @@ class TradingDashboardBot:
     
     def start_websocket(self):
         """Connect to WebSocket server and receive data"""
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        self.ws_loop = loop
+        self._tick_log_stop = asyncio.Event()
+        self._flush_task = loop.create_task(self._flush_tick_log())
         loop.run_until_complete(self.websocket_loop())
     
+    async def _flush_tick_log(self):
+        """Write the ticks queued since the last pass with one file write, off the receive loop
+
+        Runs until _tick_log_stop is set, then writes what is still queued and returns.
+        """
+        tick_log = self._tick_log
+        stop = self._tick_log_stop
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), TICK_LOG_FLUSH_S)
+            except asyncio.TimeoutError:
+                pass
+            if tick_log:
+                batch = [tick_log.popleft() for _ in range(len(tick_log))]
+                try:
+                    await asyncio.to_thread(self.logger.log_ticks, batch)
+                except Exception as e:
+                    print(f"Error writing tick log: {e}")
+            if stop.is_set():
+                return
+    
+    async def _stop_tick_log(self):
+        """Stop _flush_tick_log and wait for its final batch"""
+        self._tick_log_stop.set()
+        await self._flush_task
+    
+    def on_close(self):
+        """Window closed: flush the tick log before the daemon WS thread dies with the process"""
+        if self._flush_task is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._stop_tick_log(), self.ws_loop).result(
+                    timeout=TICK_LOG_SHUTDOWN_S)
+            except Exception as e:
+                print(f"Error flushing tick log on exit: {e}")
+        self.root.destroy()
+    
     async def websocket_loop(self):
         """WebSocket connection loop"""
         while True:
             try:
                 uri = WEBSOCKET_CONFIG["uri"]
-                async with websockets.connect(uri) as websocket:
+                # Small JSON frames: skip permessage-deflate
+                async with websockets.connect(uri, compression=None, max_size=2**20) as websocket:
                     self.connection_status = "Connected"
                     self.root.after(0, lambda: self.status_label.config(
                         text=f"Status: Connected | {self.tick_count} ticks"))
@@ -418,11 +571,16 @@ class TradingDashboardBot:
                     
                     async for message in websocket:
                         try:
-                            data = json.loads(message)
+                            # Snapshots arrive as binary frames (bytes, from encode_snapshot on the
+                            # server); trade events and acks as text. Both parsers take either type
+                            data = json_loads(message)
                             if "ticker" in data:
-                                self.root.after(0, self.update_ui, data)
-                        except json.JSONDecodeError:
-                            pass
+                                # Strategy and tick logging stay on this thread; Tk only renders
+                                msg = self._process_snapshot(data)
+                                if msg is not None:
+                                    self._queue_render(msg)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            pass  # json.loads raises UnicodeDecodeError for a malformed binary frame
                         except Exception as e:
                             print(f"Error processing message: {e}")
             